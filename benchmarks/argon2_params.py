@@ -0,0 +1,74 @@
+"""Pick argon2 parameters that hit a target verify latency on this machine.
+
+Usage::
+
+    python -m benchmarks.argon2_params --target-ms 250
+
+For every candidate memory cost the largest time cost that still verifies
+within the target is found; the suggestion is the one with the most memory,
+printed as ``.env`` lines.
+"""
+
+import argparse
+import statistics
+import time
+
+from src.routes.auth.hashing import create_password_hash
+
+MEMORY_COSTS = (19456, 32768, 47104, 65536, 131072, 262144)
+MAX_TIME_COST = 10
+
+
+def measure_verify_ms(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+    rounds: int,
+) -> float:
+    password_hash = create_password_hash(time_cost, memory_cost, parallelism)
+    hashed_password = password_hash.hash("benchmark-password")
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        password_hash.verify("benchmark-password", hashed_password)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--parallelism", type=int, default=4)
+    parser.add_argument("--max-memory-cost", type=int, default=262144)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    best = None
+    for memory_cost in MEMORY_COSTS:
+        if memory_cost > args.max_memory_cost:
+            break
+        fitting = None
+        for time_cost in range(1, MAX_TIME_COST + 1):
+            latency = measure_verify_ms(
+                time_cost, memory_cost, args.parallelism, args.rounds
+            )
+            print(f"m={memory_cost:>7} t={time_cost:>2} verify={latency:8.1f} ms")
+            if latency > args.target_ms:
+                break
+            fitting = (time_cost, memory_cost, latency)
+        if fitting is None:
+            break
+        best = fitting
+
+    if best is None:
+        print(f"No parameters verify within {args.target_ms} ms")
+        return
+    time_cost, memory_cost, latency = best
+    print(f"\n# verify ~{latency:.1f} ms")
+    print(f"ARGON2_TIME_COST={time_cost}")
+    print(f"ARGON2_MEMORY_COST={memory_cost}")
+    print(f"ARGON2_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""Load benchmarks for the auth, user and role endpoints.
+
+In-process, against a throwaway Postgres configured in ``.env``::
+
+    python -m benchmarks.run --reset
+
+Against a running server (start it with
+``DB_QUERY_INSTRUMENTATION_ENABLED=true RATE_LIMIT_ENABLED=false`` to get
+query counts and unthrottled logins)::
+
+    python -m benchmarks.run --url http://127.0.0.1:8000 --reset
+
+``--reset`` truncates every application table before seeding.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import re
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+
+from httpx import ASGITransport, AsyncClient, Response
+from sqlalchemy import text
+
+SERVER_TIMING_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    # Builds keyword arguments for ``AsyncClient.request`` per request.
+    request_kwargs: Callable[[int], dict] = lambda _: {}
+    authenticated: bool = True
+    hashes_password: bool = False
+
+
+@dataclass
+class Result:
+    scenario: str
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    queries_per_request: float | None
+    status_codes: dict[str, int] = field(default_factory=dict)
+
+
+def _register_kwargs(run_id: str) -> Callable[[int], dict]:
+    def build(i: int) -> dict:
+        return {
+            "json": {
+                "username": f"bench_reg_{run_id}_{i}",
+                "password": "bench-password",
+                "email": f"bench_reg_{run_id}_{i}@bench.example",
+                "full_name": "Bench Register",
+            }
+        }
+
+    return build
+
+
+def build_scenarios(run_id: str) -> list[Scenario]:
+    from benchmarks.seed import ADMIN_PASSWORD, ADMIN_USERNAME, USER_ROLE_ID  # noqa: PLC0415
+
+    role_body = {
+        "add_user_permission": False,
+        "read_users_permission": False,
+        "update_users_permission": False,
+        "delete_users_permission": False,
+        "read_roles_permission": False,
+        "update_roles_permission": False,
+    }
+    return [
+        Scenario(
+            "login",
+            "POST",
+            "/api/auth/login",
+            lambda _: {
+                "data": {"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD}
+            },
+            authenticated=False,
+            hashes_password=True,
+        ),
+        Scenario(
+            "register",
+            "POST",
+            "/api/auth/register",
+            _register_kwargs(run_id),
+            authenticated=False,
+            hashes_password=True,
+        ),
+        Scenario("me", "GET", "/api/auth/me"),
+        Scenario("roles_get", "GET", "/api/roles/"),
+        Scenario(
+            "roles_put",
+            "PUT",
+            f"/api/roles/{USER_ROLE_ID}",
+            lambda _: {"json": role_body},
+        ),
+    ]
+
+
+def users_scenario(size: int, max_id: int) -> Scenario:
+    """Pages of the user list starting at random cursors across the table.
+
+    Always reading the first page would cost the same at every table size;
+    sampling cursors shows how deep pages behave as the table grows.
+    """
+    return Scenario(
+        f"users_{size}",
+        "GET",
+        "/api/users/",
+        lambda _: {"params": {"limit": 100, "after": random.randrange(max_id)}},
+    )
+
+
+def _percentile(latencies: list[float], q: int) -> float:
+    if len(latencies) < 2:  # noqa: PLR2004
+        return latencies[0] if latencies else 0.0
+    return statistics.quantiles(latencies, n=100)[q - 1]
+
+
+async def run_scenario(
+    client: AsyncClient,
+    scenario: Scenario,
+    headers: dict[str, str],
+    requests: int,
+    concurrency: int,
+) -> Result:
+    latencies: list[float] = []
+    queries: list[int] = []
+    status_codes: dict[str, int] = {}
+    counter = itertools.count()
+
+    async def worker() -> None:
+        while (i := next(counter)) < requests:
+            started = time.perf_counter()
+            response: Response = await client.request(
+                scenario.method,
+                scenario.path,
+                headers=headers if scenario.authenticated else None,
+                **scenario.request_kwargs(i),
+            )
+            latencies.append((time.perf_counter() - started) * 1000)
+            code = str(response.status_code)
+            status_codes[code] = status_codes.get(code, 0) + 1
+            match = SERVER_TIMING_QUERIES.search(
+                response.headers.get("server-timing", "")
+            )
+            if match:
+                queries.append(int(match.group(1)))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    errors = sum(n for code, n in status_codes.items() if not code.startswith("2"))
+    return Result(
+        scenario=scenario.name,
+        requests=requests,
+        errors=errors,
+        rps=requests / elapsed,
+        p50_ms=_percentile(latencies, 50),
+        p95_ms=_percentile(latencies, 95),
+        p99_ms=_percentile(latencies, 99),
+        queries_per_request=statistics.mean(queries) if queries else None,
+        status_codes=status_codes,
+    )
+
+
+def print_result(result: Result) -> None:
+    queries = (
+        f"{result.queries_per_request:6.1f}"
+        if result.queries_per_request is not None
+        else "     -"
+    )
+    print(
+        f"{result.scenario:<16} {result.requests:>7} {result.errors:>6} "
+        f"{result.rps:>9.1f} {result.p50_ms:>8.2f} {result.p95_ms:>8.2f} "
+        f"{result.p99_ms:>8.2f} {queries}"
+    )
+
+
+async def benchmark(args: argparse.Namespace) -> list[Result]:
+    # src is imported lazily so main() can adjust the environment that
+    # Settings is read from first.
+    from benchmarks.seed import ADMIN_PASSWORD, ADMIN_USERNAME, grow_users, reset  # noqa: PLC0415
+    from src.dependencies.database import engine  # noqa: PLC0415
+
+    if args.reset:
+        async with engine.begin() as conn:
+            await reset(conn)
+
+    if args.url:
+        client = AsyncClient(base_url=args.url, timeout=60)
+        lifespan = None
+    else:
+        from src.main import app  # noqa: PLC0415
+
+        client = AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://bench", timeout=60
+        )
+        lifespan = app.router.lifespan_context(app)
+        await lifespan.__aenter__()
+
+    results = []
+    try:
+        response = await client.post(
+            "/api/auth/login",
+            data={"username": ADMIN_USERNAME, "password": ADMIN_PASSWORD},
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        print(
+            f"{'scenario':<16} {'reqs':>7} {'errors':>6} {'rps':>9} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'q/req':>6}"
+        )
+        scenarios = build_scenarios(uuid.uuid4().hex[:8])
+        for scenario in scenarios:
+            if args.scenarios and scenario.name not in args.scenarios:
+                continue
+            requests = args.hash_requests if scenario.hashes_password else args.requests
+            result = await run_scenario(
+                client, scenario, headers, requests, args.concurrency
+            )
+            print_result(result)
+            results.append(result)
+
+        if not args.scenarios or "users" in args.scenarios:
+            for size in args.user_counts:
+                async with engine.begin() as conn:
+                    await grow_users(conn, size)
+                    max_id = (
+                        await conn.execute(text("SELECT max(id) FROM users"))
+                    ).scalar_one()
+                result = await run_scenario(
+                    client,
+                    users_scenario(size, max_id),
+                    headers,
+                    args.requests,
+                    args.concurrency,
+                )
+                print_result(result)
+                results.append(result)
+    finally:
+        await client.aclose()
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+        await engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__.splitlines()[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split("\n", 1)[1],
+    )
+    parser.add_argument("--url", help="benchmark a running server instead")
+    parser.add_argument("--reset", action="store_true", help="truncate and reseed")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument(
+        "--hash-requests",
+        type=int,
+        default=200,
+        help="requests for scenarios that run argon2 (login, register)",
+    )
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument(
+        "--user-counts",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[1_000, 100_000, 1_000_000],
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=lambda value: value.split(","),
+        help="comma-separated subset: login,register,me,roles_get,roles_put,users",
+    )
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args()
+
+    if not args.url:
+        # Must be set before src.config is imported by the app.
+        os.environ.setdefault("DB_QUERY_INSTRUMENTATION_ENABLED", "true")
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+
+    results = asyncio.run(benchmark(args))
+    if args.json:
+        with open(args.json, "w") as f:  # noqa: PTH123
+            json.dump([asdict(result) for result in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Bulk seeding of a throwaway database for the benchmarks."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.routes.auth.hashing import password_hash
+from src.routes.role.permissions import Permission
+
+ADMIN_USERNAME = "bench_admin"
+ADMIN_PASSWORD = "bench-password"  # noqa: S105
+USER_ROLE_ID = 1
+ADMIN_ROLE_ID = 2
+
+
+async def reset(conn: AsyncConnection) -> None:
+    """Wipe all application tables and create the roles and an admin."""
+    await conn.execute(
+        text(
+            "TRUNCATE users, role_access, roles, refresh_tokens, revoked_tokens "
+            "RESTART IDENTITY CASCADE"
+        )
+    )
+    await conn.execute(
+        text("INSERT INTO roles (id, name) VALUES (:user, 'user'), (:admin, 'admin')"),
+        {"user": USER_ROLE_ID, "admin": ADMIN_ROLE_ID},
+    )
+    await conn.execute(
+        text(
+            "INSERT INTO role_access (role_id, permissions) "
+            "VALUES (:user, 0), (:admin, :all)"
+        ),
+        {
+            "user": USER_ROLE_ID,
+            "admin": ADMIN_ROLE_ID,
+            "all": sum(permission.value for permission in Permission),
+        },
+    )
+    await conn.execute(
+        text(
+            "INSERT INTO users (username, full_name, email, hashed_password, "
+            "role_id, is_active, registered_date) "
+            "VALUES (:username, 'Bench Admin', 'admin@bench.example', :hash, "
+            ":role_id, true, now())"
+        ),
+        {
+            "username": ADMIN_USERNAME,
+            "hash": password_hash.hash(ADMIN_PASSWORD),
+            "role_id": ADMIN_ROLE_ID,
+        },
+    )
+
+
+async def grow_users(conn: AsyncConnection, total: int) -> int:
+    """Add generated users until there are ``total`` of them.
+
+    Rows are produced server-side by ``generate_series`` and share one
+    password hash, so a million users take seconds rather than hours.
+    """
+    existing = (
+        await conn.execute(
+            text("SELECT count(*) FROM users WHERE username LIKE 'bench_user_%'")
+        )
+    ).scalar_one()
+    if existing >= total:
+        return existing
+    await conn.execute(
+        text(
+            "INSERT INTO users (username, full_name, email, hashed_password, "
+            "role_id, is_active, registered_date) "
+            "SELECT 'bench_user_' || i, 'Bench User ' || i, "
+            "'bench_user_' || i || '@bench.example', :hash, :role_id, true, "
+            "now() - make_interval(secs => i) "
+            "FROM generate_series(CAST(:start AS integer), CAST(:stop AS integer)) "
+            "AS i"
+        ),
+        {
+            "hash": password_hash.hash(ADMIN_PASSWORD),
+            "role_id": USER_ROLE_ID,
+            "start": existing + 1,
+            "stop": total,
+        },
+    )
+    await conn.execute(text("ANALYZE users"))
+    return total
@@ -0,0 +1,86 @@
+"""Per-row CPU cost of building and serialising a ``GET /api/users/`` page.
+
+Starts from DB row mappings and runs both through FastAPI's response path
+(validation against the response model, ``jsonable_encoder``,
+``json.dumps``):
+
+- ``model_validate`` per row (the default);
+- ``model_construct`` per row (``FAST_LIST_RESPONSES=true``).
+
+Usage::
+
+    python -m benchmarks.serialization --rows 1000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from src.routes.user.schemas import UserSchema
+
+response_field = create_model_field(name="response", type_=list[UserSchema])
+
+
+def make_rows(rows: int) -> list[dict]:
+    return [
+        {
+            "id": i,
+            "username": f"user_{i}",
+            "full_name": f"User {i}",
+            "email": f"user_{i}@example.com",
+            "registered_date": datetime(2025, 1, 1),  # noqa: DTZ001
+            "role": "user",
+        }
+        for i in range(rows)
+    ]
+
+
+async def encode(users: list[UserSchema]) -> bytes:
+    content = await serialize_response(field=response_field, response_content=users)
+    return JSONResponse(content).body
+
+
+async def validate_and_encode(rows: list[dict]) -> bytes:
+    return await encode([UserSchema.model_validate(row) for row in rows])
+
+
+async def construct_and_encode(rows: list[dict]) -> bytes:
+    return await encode([UserSchema.model_construct(**row) for row in rows])
+
+
+async def measure(
+    func: Callable[[list[dict]], Awaitable[bytes]],
+    rows: list[dict],
+    repeat: int,
+) -> float:
+    """Best per-row time in microseconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func(rows)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1_000_000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    baseline = await measure(validate_and_encode, rows, args.repeat)
+    per_row = await measure(construct_and_encode, rows, args.repeat)
+    print(f"rows: {args.rows}")
+    print(f"validate:  {baseline:8.2f} us/row")
+    print(f"construct: {per_row:8.2f} us/row ({baseline / per_row:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
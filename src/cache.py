@@ -0,0 +1,354 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+from src.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+try:
+    from redis.exceptions import RedisError
+except ImportError:  # redis is only needed with REDIS_URL
+
+    class RedisError(Exception):
+        """Stand-in so ``REDIS_ERRORS`` is defined without the redis package."""
+
+
+logger = logging.getLogger(__name__)
+
+# Errors a Redis call can fail with when the server is down or unreachable.
+REDIS_ERRORS = (RedisError, OSError)
+
+RECONNECT_DELAY_SECONDS = 1
+MAX_RECONNECT_DELAY_SECONDS = 30
+
+
+class TTLCache:
+    """Bounded in-process LRU cache whose entries expire after ``ttl`` seconds."""
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Any | None:  # noqa: ANN401
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:  # noqa: ANN401
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CacheBackend(ABC):
+    """Storage behind a ``Cache``; either per-process or shared."""
+
+    shared = False
+
+    @abstractmethod
+    async def get(self, key: str) -> BaseModel | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: BaseModel) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def clear(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, int | float]: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int, ttl: float):
+        self._cache = TTLCache(max_size=max_size, ttl=ttl)
+
+    async def get(self, key: str) -> BaseModel | None:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: BaseModel) -> None:
+        self._cache.set(key, value)
+
+    async def delete(self, key: str) -> None:
+        self._cache.invalidate(key)
+
+    async def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int | float]:
+        return self._cache.stats()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache shared by all workers, stored as JSON in any Redis-protocol server.
+
+    ``client`` is a ``redis.asyncio.Redis``-compatible client, so a fake
+    client can be swapped in locally. The cache is an optimisation, so
+    Redis errors are logged and a failed lookup is a miss rather than a
+    failed request.
+    """
+
+    shared = True
+
+    def __init__(
+        self,
+        client: "Redis",
+        namespace: str,
+        model: type[BaseModel],
+        ttl: float,
+    ):
+        self.client = client
+        self.namespace = namespace
+        self.model = model
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get(self, key: str) -> BaseModel | None:
+        try:
+            raw = await self.client.get(self._key(key))
+        except REDIS_ERRORS as err:
+            logger.warning("Redis cache get failed: %s", err)
+            raw = None
+        if raw is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.model.model_validate_json(raw)
+
+    async def set(self, key: str, value: BaseModel) -> None:
+        try:
+            await self.client.set(
+                self._key(key), value.model_dump_json(), px=int(self.ttl * 1000)
+            )
+        except REDIS_ERRORS as err:
+            logger.warning("Redis cache set failed: %s", err)
+
+    async def delete(self, key: str) -> None:
+        # A failed delete leaves the entry until it expires after ``ttl``;
+        # the change that triggered it is already committed either way.
+        try:
+            await self.client.delete(self._key(key))
+        except REDIS_ERRORS as err:
+            logger.warning("Redis cache delete of %r failed: %s", key, err)
+
+    async def clear(self) -> None:
+        try:
+            keys = [key async for key in self.client.scan_iter(match=self._key("*"))]
+            if keys:
+                await self.client.delete(*keys)
+        except REDIS_ERRORS as err:
+            logger.warning("Redis cache clear failed: %s", err)
+
+    def stats(self) -> dict[str, int | float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class InvalidationBus:
+    """Delivers cache invalidations to every ``Cache`` with the same name.
+
+    The base bus is in-process only; ``RedisInvalidationBus`` fans messages
+    out to the other workers over pub/sub.
+    """
+
+    def __init__(self):
+        self._caches: dict[str, Cache] = {}
+
+    def register(self, cache: "Cache") -> None:
+        self._caches[cache.name] = cache
+
+    async def publish(self, name: str, key: str | None) -> None:
+        pass
+
+    async def start(self) -> None:
+        pass
+
+    async def stop(self) -> None:
+        pass
+
+    async def _deliver(self, name: str, key: str | None) -> None:
+        cache = self._caches.get(name)
+        if cache is not None:
+            await cache.apply_invalidation(key)
+
+
+class RedisInvalidationBus(InvalidationBus):
+    def __init__(self, client: "Redis", channel: str):
+        super().__init__()
+        self.client = client
+        self.channel = channel
+        self._sender = uuid.uuid4().hex
+        self._listener: asyncio.Task | None = None
+
+    async def publish(self, name: str, key: str | None) -> None:
+        # Best effort: a worker that misses the message keeps a stale entry
+        # for at most the cache TTL, and clears its local caches when its
+        # subscription is restored.
+        try:
+            await self.client.publish(
+                self.channel,
+                json.dumps({"sender": self._sender, "cache": name, "key": key}),
+            )
+        except REDIS_ERRORS as err:
+            logger.warning("Cache invalidation publish failed: %s", err)
+
+    async def start(self) -> None:
+        self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+
+    async def _listen(self) -> None:
+        """Apply invalidations from other workers, resubscribing on errors."""
+        delay = RECONNECT_DELAY_SECONDS
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Invalidations published while unsubscribed were missed, so
+                # whatever this worker cached in the meantime may be stale.
+                await self._clear_local_caches()
+                delay = RECONNECT_DELAY_SECONDS
+                async for message in pubsub.listen():
+                    await self._handle(message)
+            except Exception:
+                logger.exception(
+                    "Cache invalidation listener failed, resubscribing in %s s",
+                    delay,
+                )
+            finally:
+                with contextlib.suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY_SECONDS)
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        if message["type"] != "message":
+            return
+        try:
+            payload = json.loads(message["data"])
+        except ValueError:
+            logger.warning("Malformed cache invalidation message")
+            return
+        if payload.get("sender") == self._sender:
+            return
+        await self._deliver(payload.get("cache"), payload.get("key"))
+
+    async def _clear_local_caches(self) -> None:
+        for cache in self._caches.values():
+            if not cache.backend.shared:
+                await cache.backend.clear()
+
+
+class Cache:
+    """Named cache of pydantic models with cross-worker invalidation."""
+
+    def __init__(self, name: str, backend: CacheBackend, bus: InvalidationBus):
+        self.name = name
+        self.backend = backend
+        self.bus = bus
+        bus.register(self)
+
+    async def get(self, key: str) -> BaseModel | None:
+        return await self.backend.get(key)
+
+    async def set(self, key: str, value: BaseModel) -> None:
+        await self.backend.set(key, value)
+
+    async def invalidate(self, key: str | None = None) -> None:
+        """Drop ``key`` (or everything when ``None``) in every worker."""
+        await self.apply_invalidation(key)
+        await self.bus.publish(self.name, key)
+
+    async def apply_invalidation(self, key: str | None) -> None:
+        if key is None:
+            await self.backend.clear()
+        else:
+            await self.backend.delete(key)
+
+    def stats(self) -> dict[str, int | float]:
+        return self.backend.stats()
+
+
+def redis_client() -> "Redis":
+    try:
+        from redis.asyncio import Redis  # noqa: PLC0415
+    except ImportError as err:
+        msg = "The redis package is required for REDIS_URL"
+        raise RuntimeError(msg) from err
+    return Redis.from_url(settings.REDIS_URL)
+
+
+def create_invalidation_bus() -> InvalidationBus:
+    if settings.REDIS_URL is None:
+        return InvalidationBus()
+    return RedisInvalidationBus(redis_client(), settings.CACHE_INVALIDATION_CHANNEL)
+
+
+def create_cache(
+    name: str,
+    model: type[BaseModel],
+    max_size: int,
+    ttl: float,
+) -> Cache:
+    if settings.CACHE_BACKEND == "redis":
+        backend = RedisCacheBackend(redis_client(), name, model, ttl)
+    else:
+        backend = MemoryCacheBackend(max_size=max_size, ttl=ttl)
+    return Cache(name, backend, invalidation_bus)
+
+
+invalidation_bus = create_invalidation_bus()
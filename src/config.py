@@ -1,5 +1,6 @@
-from typing import ClassVar
+from typing import Literal
 
+from pydantic import model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -10,8 +11,71 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int
     POSTGRES_DB: str
     JWT_SECRET_KEY: str
+    JWT_ALGORITHM: Literal["HS256", "RS256", "EdDSA"] = "HS256"
+    JWT_PRIVATE_KEY_FILES: dict[str, str] = {}
+    JWT_PUBLIC_KEY_FILES: dict[str, str] = {}
+    JWT_ACTIVE_KID: str | None = None
+    JWKS_MAX_AGE_SECONDS: int = 3600
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 10
 
-    ALGORITHM: ClassVar[str] = "HS256"
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_COMMAND_TIMEOUT: float | None = 60
+    DB_REPLICA_URLS: list[str] = []
+    DB_REPLICA_HEALTH_CHECK_SECONDS: float = 5
+    DB_QUERY_INSTRUMENTATION_ENABLED: bool = False
+    DB_SLOW_QUERY_SECONDS: float = 0.5
+
+    METRICS_ENABLED: bool = True
+
+    PASSWORD_HASHING_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHING_MAX_WORKERS: int = 4
+    PASSWORD_HASHING_MAX_QUEUE: int = 64
+    ARGON2_TIME_COST: int = 3
+    ARGON2_MEMORY_COST: int = 65536
+    ARGON2_PARALLELISM: int = 4
+
+    BULK_REGISTER_MAX_ROWS: int = 1000
+    BULK_REGISTER_MAX_CSV_BYTES: int = 1024 * 1024
+    FAST_LIST_RESPONSES: bool = False
+
+    CACHE_BACKEND: Literal["memory", "redis"] = "memory"
+    REDIS_URL: str | None = None
+    CACHE_INVALIDATION_CHANNEL: str = "cache-invalidation"
+
+    AUTH_USER_CACHE_ENABLED: bool = True
+    AUTH_USER_CACHE_MAX_SIZE: int = 10_000
+    AUTH_USER_CACHE_TTL_SECONDS: float = 30
+
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: Literal["memory", "redis"] = "memory"
+    RATE_LIMIT_MAX_KEYS: int = 100_000
+    RATE_LIMIT_WINDOW_SECONDS: float = 60
+    LOGIN_RATE_LIMIT_PER_USERNAME: int = 10
+    LOGIN_RATE_LIMIT_PER_IP: int = 100
+    REGISTER_RATE_LIMIT_PER_IP: int = 20
+
+    @model_validator(mode="after")
+    def check_redis_url(self) -> "Settings":
+        for name in ("CACHE_BACKEND", "RATE_LIMIT_BACKEND"):
+            if getattr(self, name) == "redis" and self.REDIS_URL is None:
+                msg = f"{name}=redis requires REDIS_URL"
+                raise ValueError(msg)
+        return self
+
+    @property
+    def DATABASE_URL(self) -> str:  # noqa: N802
+        return (
+            f"postgresql+asyncpg://{self.POSTGRES_USER}:"
+            f"{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:"
+            f"{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+        )
 
     class Config:
         env_file = ".env"
@@ -1,43 +1,100 @@
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 from typing import Annotated
 
-import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 
 from src.config import settings
+from src.metrics import auth_failures
+from src.routes.auth.cache import auth_user_cache
+from src.routes.auth.keys import jwt_key_ring
+from src.routes.auth.revocation import revocation_list
 from src.routes.auth.schemas import TokenData
-from src.routes.user.schemas import UserInDBSchema, UserSchema
+from src.routes.role.permissions import Permission
+from src.routes.user.schemas import UserPrincipalSchema
 from src.routes.user.service import UserServiceDep
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    user_service: UserServiceDep,
-) -> UserSchema:
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+async def get_token_data(
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> TokenData:
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = jwt_key_ring.decode(token)
         username: str | None = payload.get("sub")
         if username is None:
-            raise credentials_exception
-        token_data = TokenData(username=username)
+            auth_failures.inc("invalid_token")
+            raise _credentials_exception()
+        token_data = TokenData(
+            username=username,
+            jti=payload.get("jti"),
+            expires_at=datetime.fromtimestamp(payload["exp"]),  # noqa: DTZ006
+        )
     except InvalidTokenError as err:
-        raise credentials_exception from err
+        auth_failures.inc("invalid_token")
+        raise _credentials_exception() from err
+
+    if token_data.jti is not None and revocation_list.is_revoked(token_data.jti):
+        auth_failures.inc("revoked_token")
+        raise _credentials_exception()
+    return token_data
+
+
+TokenDataDep = Annotated[TokenData, Depends(get_token_data)]
+
+
+async def get_current_user(
+    token_data: TokenDataDep,
+    user_service: UserServiceDep,
+) -> UserPrincipalSchema:
+    user = None
+    if settings.AUTH_USER_CACHE_ENABLED:
+        user = await auth_user_cache.get(token_data.username)
 
-    user = await user_service.get_user_by_username(token_data.username)
     if user is None:
-        raise credentials_exception
+        user = await user_service.get_principal_by_username(token_data.username)
+        if user is None:
+            auth_failures.inc("unknown_user")
+            raise _credentials_exception()
+        if settings.AUTH_USER_CACHE_ENABLED:
+            await auth_user_cache.set(token_data.username, user)
+
+    if not user.is_active:
+        auth_failures.inc("inactive_user")
+        raise _credentials_exception()
     return user
 
 
-AuthUserDep = Annotated[UserInDBSchema, Depends(get_current_user)]
+AuthUserDep = Annotated[UserPrincipalSchema, Depends(get_current_user)]
+
+
+def require_permissions(
+    *permissions: Permission,
+    detail: str = "You do not have permission to perform this action",
+) -> Callable[[UserPrincipalSchema], Awaitable[UserPrincipalSchema]]:
+    """Build a dependency that requires all given permissions at once."""
+    required = Permission(0)
+    for permission in permissions:
+        required |= permission
+
+    async def check_permissions(current_user: AuthUserDep) -> UserPrincipalSchema:
+        if not current_user.has_permission(required):
+            auth_failures.inc("forbidden")
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=detail,
+            )
+        return current_user
+
+    return check_permissions
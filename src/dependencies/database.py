@@ -1,34 +1,317 @@
-from typing import Annotated
+import asyncio
+import contextlib
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Annotated, Any
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, ExceptionContext, Result
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.config import settings
 
-engine = create_async_engine(
-    f"postgresql+asyncpg://{settings.POSTGRES_USER}:"
-    f"{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:"
-    f"{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}",
-)
+logger = logging.getLogger(__name__)
 
-AsyncSessionLocal = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    wait_count = 0
+    wait_seconds_total = 0.0
+    wait_seconds_max = 0.0
+
+    def _do_get(self):  # noqa: ANN202
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - started
+            self.wait_count += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+
+class QueryStats:
+    """Queries run and time spent in the database during one request.
+
+    Only statements sent through a cursor are counted; the BEGIN and COMMIT
+    round trips around them are not.
+    """
+
+    __slots__ = ("count", "scope", "seconds")
+
+    def __init__(self, scope: dict[str, Any]):
+        self.count = 0
+        self.seconds = 0.0
+        self.scope = scope
+
+    @property
+    def route(self) -> str:
+        # The router stores the matched route in the scope, so by the time
+        # a query runs this resolves to the path template.
+        route = self.scope.get("route")
+        return route.path if route is not None else self.scope["path"]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _before_cursor_execute(
+    conn: Connection,
+    _cursor: Any,  # noqa: ANN401
+    _statement: str,
+    _parameters: Any,  # noqa: ANN401
+    _context: Any,  # noqa: ANN401
+    _executemany: bool,
+) -> None:
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(
+    conn: Connection,
+    _cursor: Any,  # noqa: ANN401
+    statement: str,
+    _parameters: Any,  # noqa: ANN401
+    _context: Any,  # noqa: ANN401
+    _executemany: bool,
+) -> None:
+    elapsed = time.perf_counter() - conn.info["query_started"].pop()
+    stats = query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+    if elapsed >= settings.DB_SLOW_QUERY_SECONDS:
+        logger.warning(
+            "Slow query (%.1f ms) on %s: %s",
+            elapsed * 1000,
+            stats.route if stats is not None else "-",
+            statement,
+        )
+
+
+def _handle_error(context: ExceptionContext) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start
+    # time so the next statement on this pooled connection is not paired
+    # with it.
+    conn = context.connection
+    if conn is not None and conn.info.get("query_started"):
+        conn.info["query_started"].pop()
+
+
+def _instrument_queries(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+
+
+def _create_engine(url: str) -> AsyncEngine:
+    engine = create_async_engine(
+        url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+        },
+    )
+    if settings.DB_QUERY_INSTRUMENTATION_ENABLED:
+        _instrument_queries(engine)
+    return engine
+
+
+class ReadOnlySession(AsyncSession):
+    """Autocommit session that hands its connection back after each statement.
+
+    ``execute`` buffers the whole result, so releasing the connection right
+    away loses nothing, and a request never holds a read connection while
+    it waits for another one for its writes. ``stream`` keeps the
+    connection until the session is closed.
+    """
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Result:  # noqa: ANN401
+        try:
+            return await super().execute(*args, **kwargs)
+        finally:
+            await self.close()
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        try:
+            return await super().scalar(*args, **kwargs)
+        finally:
+            await self.close()
+
+
+def _create_sessionmaker(
+    bind: AsyncEngine,
+    class_: type[AsyncSession] = AsyncSession,
+) -> sessionmaker:
+    return sessionmaker(
+        bind=bind,
+        class_=class_,
+        expire_on_commit=False,
+    )
+
+
+def _create_read_sessionmaker(bind: AsyncEngine) -> sessionmaker:
+    # Reads run in autocommit mode: no BEGIN before a query and no COMMIT
+    # after it, saving two round trips per request.
+    return _create_sessionmaker(
+        bind.execution_options(isolation_level="AUTOCOMMIT"),
+        ReadOnlySession,
+    )
+
+
+engine = _create_engine(settings.DATABASE_URL)
+
+AsyncSessionLocal = _create_sessionmaker(engine)
+ReadOnlySessionLocal = _create_read_sessionmaker(engine)
 
 base = declarative_base()
 
 
+class ReplicaRouter:
+    """Hands out replica sessions round-robin, skipping unhealthy replicas.
+
+    Sessions connect lazily on their first query, so handing one out costs
+    nothing when the request never reads. Health is tracked by a background
+    probe every ``health_check_seconds`` and by connection errors seen on
+    live queries, never by a round trip on the request path.
+    """
+
+    def __init__(self, urls: list[str], health_check_seconds: float):
+        self.engines = [_create_engine(url) for url in urls]
+        self.session_makers = [_create_read_sessionmaker(e) for e in self.engines]
+        self.health_check_seconds = health_check_seconds
+        self.healthy = [True] * len(self.engines)
+        self._counter = itertools.count()
+        self._task: asyncio.Task | None = None
+
+    def pick(self) -> int | None:
+        """Index of the next healthy replica, or ``None`` if there is none."""
+        if not self.engines:
+            return None
+        start = next(self._counter) % len(self.engines)
+        for offset in range(len(self.engines)):
+            index = (start + offset) % len(self.engines)
+            if self.healthy[index]:
+                return index
+        return None
+
+    def mark_down(self, index: int) -> None:
+        if self.healthy[index]:
+            logger.warning("Read replica %d is down", index)
+        self.healthy[index] = False
+
+    def mark_up(self, index: int) -> None:
+        if not self.healthy[index]:
+            logger.info("Read replica %d is back up", index)
+        self.healthy[index] = True
+
+    async def probe(self) -> None:
+        for index, replica in enumerate(self.engines):
+            try:
+                async with asyncio.timeout(self.health_check_seconds):
+                    async with replica.connect() as conn:
+                        await conn.execute(text("SELECT 1"))
+            except (OSError, DBAPIError):
+                self.mark_down(index)
+            else:
+                self.mark_up(index)
+
+    async def start(self) -> None:
+        if not self.engines:
+            return
+        await self.probe()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_seconds)
+            try:
+                await self.probe()
+            except Exception:
+                logger.exception("Read replica health check failed")
+
+
+replica_router = ReplicaRouter(
+    settings.DB_REPLICA_URLS,
+    health_check_seconds=settings.DB_REPLICA_HEALTH_CHECK_SECONDS,
+)
+
+
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
         try:
             yield session
-        except Exception as e:
+        except Exception:
             await session.rollback()
-            raise e
-        await session.commit()
+            raise
+        if session.in_transaction():
+            await session.commit()
 
 
 DBSessionDep = Annotated[AsyncSession, Depends(get_db)]
+
+
+async def get_read_db() -> AsyncSession:
+    """Autocommit session for read-only queries, never committed.
+
+    Uses a replica when one is up and the primary otherwise. Reads do not
+    see the request's uncommitted writes, as they would not on a replica.
+    """
+    index = replica_router.pick()
+    if index is None:
+        session = ReadOnlySessionLocal()
+    else:
+        session = replica_router.session_makers[index]()
+    try:
+        yield session
+    except (OSError, DBAPIError) as err:
+        if index is not None and (
+            isinstance(err, OSError) or err.connection_invalidated
+        ):
+            replica_router.mark_down(index)
+        raise
+    finally:
+        await session.close()
+
+
+ReadDBSessionDep = Annotated[AsyncSession, Depends(get_read_db)]
+
+
+def _pool_stats(pool: InstrumentedQueuePool) -> dict[str, int | float]:
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        # QueuePool.overflow() counts from -pool_size while the pool is not
+        # yet full; only connections beyond pool_size are reported.
+        "overflow": max(pool.overflow(), 0),
+        "wait_count": pool.wait_count,
+        "wait_seconds_total": pool.wait_seconds_total,
+        "wait_seconds_max": pool.wait_seconds_max,
+    }
+
+
+def get_pool_stats() -> dict[str, dict[str, int | float]]:
+    stats = {"primary": _pool_stats(engine.pool)}
+    for index, replica in enumerate(replica_router.engines):
+        stats[f"replica_{index}"] = _pool_stats(replica.pool)
+    return stats
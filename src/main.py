@@ -1,6 +1,39 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
-from src.routes import api_router
+from src.cache import invalidation_bus
+from src.config import settings
+from src.dependencies.database import AsyncSessionLocal, replica_router
+from src.middleware import MetricsMiddleware, QueryTimingMiddleware
+from src.routes import api_router, metrics_router, well_known_router
+from src.routes.auth.revocation import revocation_list
+from src.routes.role.directory import role_directory
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    async with AsyncSessionLocal() as session:
+        await role_directory.load(session)
+    await revocation_list.start(
+        AsyncSessionLocal, settings.TOKEN_REVOCATION_SYNC_SECONDS
+    )
+    await invalidation_bus.start()
+    await replica_router.start()
+    try:
+        yield
+    finally:
+        await replica_router.stop()
+        await invalidation_bus.stop()
+        await revocation_list.stop()
+
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+if settings.DB_QUERY_INSTRUMENTATION_ENABLED:
+    app.add_middleware(QueryTimingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
 app.include_router(api_router)
+app.include_router(well_known_router)
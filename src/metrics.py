@@ -0,0 +1,152 @@
+"""Minimal Prometheus text-format metrics.
+
+All updates happen on the event loop thread, so counters are plain number
+increments without locks; values are only formatted when ``/metrics`` is
+scraped.
+"""
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"'
+        for name, value in zip(names, values, strict=True)
+    )
+    return f"{{{pairs}}}" if pairs else ""
+
+
+def format_metric(
+    name: str,
+    kind: str,
+    documentation: str,
+    samples: Iterable[tuple[str, float]],
+) -> list[str]:
+    """Render one metric family from ``(name_with_labels, value)`` samples."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{sample} {value}" for sample, value in samples)
+    return lines
+
+
+class Metric(ABC):
+    """One metric family; subclasses provide its samples."""
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+
+    def render(self) -> list[str]:
+        return format_metric(self.name, self.kind, self.documentation, self.samples())
+
+    @abstractmethod
+    def samples(self) -> Iterable[tuple[str, float]]: ...
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+    ):
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[tuple[str, ...], float] = {} if labelnames else {(): 0}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def samples(self) -> Iterable[tuple[str, float]]:
+        for labels, value in self._values.items():
+            yield self.name + format_labels(self.labelnames, labels), value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = buckets
+        # Per label set: counts per bucket (last one is +Inf), sum.
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        counts, total = entry
+        counts[bisect_left(self.buckets, value)] += 1
+        total[0] += value
+
+    def samples(self) -> Iterable[tuple[str, float]]:
+        labelnames = (*self.labelnames, "le")
+        for labels, (counts, total) in self._values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts, strict=True):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket"
+                    + format_labels(labelnames, (*labels, str(bound))),
+                    cumulative,
+                )
+            suffix = format_labels(self.labelnames, labels)
+            yield f"{self.name}_sum{suffix}", total[0]
+            yield f"{self.name}_count{suffix}", cumulative
+
+
+http_requests = Counter(
+    "http_requests_total",
+    "HTTP requests by route and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route"),
+)
+http_requests_in_flight = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+auth_failures = Counter(
+    "auth_failures_total",
+    "Rejected authentication attempts by reason.",
+    ("reason",),
+)
+
+registry: list[Metric] = [
+    http_requests,
+    http_request_duration,
+    http_requests_in_flight,
+    auth_failures,
+]
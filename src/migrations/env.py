@@ -5,6 +5,7 @@ from sqlalchemy import engine_from_config, pool
 
 from src.config import settings
 from src.dependencies.database import base
+from src.routes.auth.models import RefreshToken, RevokedToken  # noqa: F401
 from src.routes.role.models import Role, RoleAccess  # noqa: F401
 from src.routes.user.models import User  # noqa: F401
 
@@ -19,16 +20,12 @@ if config.config_file_name is not None:
 
 config.set_main_option(
     "sqlalchemy.url",
-    f"postgresql+asyncpg://{settings.POSTGRES_USER}:"
-    f"{settings.POSTGRES_PASSWORD}@{settings.POSTGRES_HOST}:"
-    f"{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
-    f"?async_fallback=True",
+    f"{settings.DATABASE_URL}?async_fallback=True",
 )
 
 target_metadata = base.metadata
 
 
-
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -67,9 +64,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(
-            connection=connection, target_metadata=target_metadata
-        )
+        context.configure(connection=connection, target_metadata=target_metadata)
 
         with context.begin_transaction():
             context.run_migrations()
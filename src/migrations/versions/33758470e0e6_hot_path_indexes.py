@@ -0,0 +1,59 @@
+"""hot path indexes
+
+Revision ID: 33758470e0e6
+Revises: 1e21e4da1b48
+Create Date: 2026-10-18 11:18:45.298002
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "33758470e0e6"
+down_revision: str | Sequence[str] | None = "1e21e4da1b48"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Indexes are built CONCURRENTLY so the tables stay writable; that cannot
+    run inside a transaction, hence the autocommit block. The unique
+    constraint is then attached to the ready index without another scan.
+    """
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "role_access_role_id_key",
+            "role_access",
+            ["role_id"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            op.f("ix_users_role_id"),
+            "users",
+            ["role_id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+    op.execute(
+        "ALTER TABLE role_access ADD CONSTRAINT role_access_role_id_key "
+        "UNIQUE USING INDEX role_access_role_id_key"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("role_access_role_id_key", "role_access", type_="unique")
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_users_role_id"),
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
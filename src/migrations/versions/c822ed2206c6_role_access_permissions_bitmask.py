@@ -0,0 +1,59 @@
+"""role access permissions bitmask
+
+Revision ID: c822ed2206c6
+Revises: 8cf512941921
+Create Date: 2026-10-18 11:05:12.418306
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c822ed2206c6"
+down_revision: str | Sequence[str] | None = "8cf512941921"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Bit values mirror src.routes.role.permissions.Permission at the time of
+# this migration; they are inlined so the migration never changes meaning.
+PERMISSION_BITS = {
+    "add_user_permission": 1,
+    "read_users_permission": 2,
+    "update_users_permission": 4,
+    "delete_users_permission": 8,
+    "read_roles_permission": 16,
+    "update_roles_permission": 32,
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "role_access",
+        sa.Column("permissions", sa.Integer(), server_default="0", nullable=False),
+    )
+    mask = " | ".join(
+        f"(CASE WHEN {column} THEN {bit} ELSE 0 END)"
+        for column, bit in PERMISSION_BITS.items()
+    )
+    op.execute(f"UPDATE role_access SET permissions = {mask}")  # noqa: S608
+    for column in PERMISSION_BITS:
+        op.drop_column("role_access", column)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in PERMISSION_BITS:
+        op.add_column(
+            "role_access",
+            sa.Column(column, sa.Boolean(), autoincrement=False, nullable=True),
+        )
+    assignments = ", ".join(
+        f"{column} = (permissions & {bit}) <> 0"
+        for column, bit in PERMISSION_BITS.items()
+    )
+    op.execute(f"UPDATE role_access SET {assignments}")  # noqa: S608
+    op.drop_column("role_access", "permissions")
@@ -0,0 +1,118 @@
+import logging
+import math
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+from src.cache import REDIS_ERRORS, redis_client
+from src.config import settings
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitBackend(ABC):
+    """Sliding-window hit counter shared by every ``RateLimiter``."""
+
+    @abstractmethod
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        """Record a hit for ``key`` unless ``limit`` hits already fell
+        within the last ``window`` seconds; return whether it was allowed.
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Per-process sliding-window log with LRU eviction of idle keys."""
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._hits: OrderedDict[str, deque[float]] = OrderedDict()
+
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        now = time.monotonic()
+        hits = self._hits.get(key)
+        if hits is None:
+            hits = self._hits[key] = deque()
+        else:
+            self._hits.move_to_end(key)
+        while hits and hits[0] <= now - window:
+            hits.popleft()
+        if len(hits) >= limit:
+            return False
+        hits.append(now)
+        while len(self._hits) > self.max_keys:
+            self._hits.popitem(last=False)
+        return True
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Sliding-window log kept in a Redis sorted set, shared by all workers.
+
+    Fails open: while Redis is unreachable every hit is allowed and the
+    error is logged. Login still needs a valid password, and rejecting all
+    logins and registrations during an outage would be worse than briefly
+    not limiting them.
+    """
+
+    def __init__(self, client: "Redis", namespace: str):
+        self.client = client
+        self.namespace = namespace
+
+    async def hit(self, key: str, limit: int, window: float) -> bool:
+        now = time.time()
+        redis_key = f"{self.namespace}:{key}"
+        member = f"{now}:{uuid.uuid4().hex}"
+        try:
+            async with self.client.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(redis_key, 0, now - window)
+                pipe.zadd(redis_key, {member: now})
+                pipe.zcard(redis_key)
+                pipe.expire(redis_key, math.ceil(window))
+                _, _, count, _ = await pipe.execute()
+            if count > limit:
+                await self.client.zrem(redis_key, member)
+                return False
+        except REDIS_ERRORS as err:
+            logger.warning("Rate limit check failed, allowing the request: %s", err)
+        return True
+
+
+class RateLimiter:
+    """Allows at most ``limit`` hits per key within ``window`` seconds."""
+
+    def __init__(
+        self,
+        name: str,
+        backend: RateLimitBackend,
+        limit: int,
+        window: float,
+    ):
+        self.name = name
+        self.backend = backend
+        self.limit = limit
+        self.window = window
+        self.allowed = 0
+        self.shed = 0
+
+    async def hit(self, key: str) -> bool:
+        if await self.backend.hit(f"{self.name}:{key}", self.limit, self.window):
+            self.allowed += 1
+            return True
+        self.shed += 1
+        return False
+
+    def stats(self) -> dict[str, int]:
+        return {"allowed": self.allowed, "shed": self.shed}
+
+
+def create_rate_limit_backend() -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        return RedisRateLimitBackend(redis_client(), "rate-limit")
+    return MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
+rate_limit_backend = create_rate_limit_backend()
@@ -1,3 +1,5 @@
+from src.routes.auth.router import well_known_router
+from src.routes.metrics.router import metrics_router
 from src.routes.router import api_router
 
-__all__ = ["api_router"]
+__all__ = ["api_router", "metrics_router", "well_known_router"]
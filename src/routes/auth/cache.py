@@ -0,0 +1,10 @@
+from src.cache import create_cache
+from src.config import settings
+from src.routes.user.schemas import UserPrincipalSchema
+
+auth_user_cache = create_cache(
+    "auth_user",
+    UserPrincipalSchema,
+    max_size=settings.AUTH_USER_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL_SECONDS,
+)
@@ -0,0 +1,124 @@
+from datetime import datetime
+from typing import Annotated
+
+from fastapi import Depends
+from sqlalchemy import insert, select, update
+
+from src.dependencies.database import DBSessionDep
+from src.routes.auth.models import RefreshToken, RevokedToken
+from src.routes.user.models import User
+
+
+class RefreshTokenDataAccess:
+    def __init__(self, db_session: DBSessionDep):
+        self.db_session = db_session
+
+    async def add_token(
+        self,
+        user_id: int,
+        token_hash: str,
+        expires_at: datetime,
+    ) -> None:
+        await self.db_session.execute(
+            insert(RefreshToken).values(
+                user_id=user_id,
+                token_hash=token_hash,
+                expires_at=expires_at,
+            )
+        )
+        await self.db_session.commit()
+
+    async def rotate_token(
+        self,
+        token_hash: str,
+        new_token_hash: str,
+        expires_at: datetime,
+    ) -> str | None:
+        """Swap a live refresh token for a new one and return its username.
+
+        Returns ``None`` for an unknown, expired or revoked token and for an
+        inactive user. Presenting a token that is already revoked means it
+        was copied, so every token of that user is revoked as well; the
+        other cases leave the user's sessions alone.
+        """
+        now = datetime.now()  # noqa: DTZ005
+        res = await self.db_session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+                RefreshToken.expires_at > now,
+                RefreshToken.user_id == User.id,
+                User.is_active.is_(True),
+            )
+            .values(revoked_at=now)
+            .returning(RefreshToken.user_id, User.username)
+        )
+        row = res.first()
+        if row is None:
+            await self.db_session.execute(
+                update(RefreshToken)
+                .where(
+                    RefreshToken.user_id
+                    == select(RefreshToken.user_id)
+                    .where(
+                        RefreshToken.token_hash == token_hash,
+                        RefreshToken.revoked_at.is_not(None),
+                    )
+                    .scalar_subquery(),
+                    RefreshToken.revoked_at.is_(None),
+                )
+                .values(revoked_at=now)
+            )
+            await self.db_session.commit()
+            return None
+
+        await self.db_session.execute(
+            insert(RefreshToken).values(
+                user_id=row.user_id,
+                token_hash=new_token_hash,
+                expires_at=expires_at,
+            )
+        )
+        await self.db_session.commit()
+        return row.username
+
+    async def revoke_user_tokens(self, user_id: int) -> None:
+        await self.db_session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now())  # noqa: DTZ005
+        )
+
+    async def revoke_token(self, user_id: int, token_hash: str) -> None:
+        await self.db_session.execute(
+            update(RefreshToken)
+            .where(
+                RefreshToken.user_id == user_id,
+                RefreshToken.token_hash == token_hash,
+                RefreshToken.revoked_at.is_(None),
+            )
+            .values(revoked_at=datetime.now())  # noqa: DTZ005
+        )
+
+
+class RevokedTokenDataAccess:
+    def __init__(self, db_session: DBSessionDep):
+        self.db_session = db_session
+
+    async def add_token(self, jti: str, expires_at: datetime) -> None:
+        await self.db_session.execute(
+            insert(RevokedToken).values(jti=jti, expires_at=expires_at)
+        )
+        await self.db_session.commit()
+
+
+RefreshTokenDataAccessDep = Annotated[
+    RefreshTokenDataAccess, Depends(RefreshTokenDataAccess)
+]
+RevokedTokenDataAccessDep = Annotated[
+    RevokedTokenDataAccess, Depends(RevokedTokenDataAccess)
+]
@@ -0,0 +1,140 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, status
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from src.config import settings
+
+
+def create_password_hash(
+    time_cost: int,
+    memory_cost: int,
+    parallelism: int,
+) -> PasswordHash:
+    return PasswordHash(
+        (
+            Argon2Hasher(
+                time_cost=time_cost,
+                memory_cost=memory_cost,
+                parallelism=parallelism,
+            ),
+        )
+    )
+
+
+password_hash = create_password_hash(
+    settings.ARGON2_TIME_COST,
+    settings.ARGON2_MEMORY_COST,
+    settings.ARGON2_PARALLELISM,
+)
+
+
+def _hash(password: str) -> str:
+    return password_hash.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return password_hash.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    """Runs argon2 hashing off the event loop in a bounded worker pool.
+
+    At most ``max_workers`` jobs run at once and at most ``max_queue`` more
+    may wait for a free worker; anything beyond that is rejected with 503.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        max_workers: int,
+        max_queue: int,
+    ):
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_workers)
+        self._pending = 0
+
+    @property
+    def in_flight(self) -> int:
+        return min(self._pending, self.max_workers)
+
+    @property
+    def queue_depth(self) -> int:
+        return max(self._pending - self.max_workers, 0)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(_verify, password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Whether the hash was made with other argon2 parameters.
+
+        Only parses the hash, so it is cheap enough for the event loop.
+        """
+        hasher = password_hash.current_hasher
+        return not hasher.identify(hashed_password) or hasher.check_needs_rehash(
+            hashed_password
+        )
+
+    async def hash_many(self, passwords: list[str]) -> list[str]:
+        """Hash a batch of passwords, ``max_workers`` at a time.
+
+        Every hash goes through the same queue cap as single requests, so a
+        large import is rejected with 503 instead of starving logins, and
+        logins interleave with a running import.
+        """
+        hashed_passwords = []
+        for start in range(0, len(passwords), self.max_workers):
+            chunk = passwords[start : start + self.max_workers]
+            hashed_passwords.extend(
+                await asyncio.gather(*(self._run(_hash, p) for p in chunk))
+            )
+        return hashed_passwords
+
+    async def _run(self, func, *args):  # noqa: ANN001, ANN002, ANN202
+        if self._pending >= self.max_workers + self.max_queue:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Server is busy, try again later",
+                headers={"Retry-After": "1"},
+            )
+        return await self._submit(func, *args)
+
+    async def _submit(self, func, *args):  # noqa: ANN001, ANN002, ANN202
+        self._pending += 1
+        try:
+            async with self._semaphore:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.executor, func, *args)
+        finally:
+            self._pending -= 1
+
+
+def _create_executor() -> Executor:
+    if settings.PASSWORD_HASHING_EXECUTOR == "process":
+        return ProcessPoolExecutor(max_workers=settings.PASSWORD_HASHING_MAX_WORKERS)
+    return ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+        thread_name_prefix="password-hashing",
+    )
+
+
+password_hasher = PasswordHasher(
+    _create_executor(),
+    max_workers=settings.PASSWORD_HASHING_MAX_WORKERS,
+    max_queue=settings.PASSWORD_HASHING_MAX_QUEUE,
+)
+
+
+def get_password_hasher() -> PasswordHasher:
+    return password_hasher
+
+
+PasswordHasherDep = Annotated[PasswordHasher, Depends(get_password_hasher)]
@@ -0,0 +1,91 @@
+from pathlib import Path
+from typing import Any
+
+import jwt
+from jwt.algorithms import get_default_algorithms
+from jwt.exceptions import InvalidTokenError
+
+from src.config import settings
+
+SYMMETRIC_ALGORITHMS = frozenset({"HS256"})
+
+
+class JWTKeyRing:
+    """Signs and verifies access tokens.
+
+    With an asymmetric algorithm every token carries the ``kid`` of the key
+    that signed it, and the public halves of all known keys are published as
+    a JWKS so other services can verify tokens themselves. Rotating means
+    adding a new private key, making it active, and keeping the old public
+    key around until the tokens it signed have expired.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret: str,
+        private_keys: dict[str, bytes],
+        public_keys: dict[str, bytes],
+        active_kid: str | None,
+    ):
+        self.algorithm = algorithm
+        self._secret = secret
+        self._signing_key = None
+        self._verification_keys: dict[str, Any] = {}
+        self.active_kid = active_kid
+        self.jwks: dict[str, list[dict[str, Any]]] = {"keys": []}
+        if algorithm in SYMMETRIC_ALGORITHMS:
+            return
+
+        if active_kid not in private_keys:
+            msg = "JWT_ACTIVE_KID must name one of JWT_PRIVATE_KEY_FILES"
+            raise RuntimeError(msg)
+        implementation = get_default_algorithms()[algorithm]
+        for kid, pem in private_keys.items():
+            private_key = implementation.prepare_key(pem)
+            if kid == active_kid:
+                self._signing_key = private_key
+            self._verification_keys[kid] = private_key.public_key()
+        for kid, pem in public_keys.items():
+            self._verification_keys[kid] = implementation.prepare_key(pem)
+        self.jwks = {"keys": []}
+        for kid, key in self._verification_keys.items():
+            jwk = implementation.to_jwk(key, as_dict=True)
+            # PyJWT adds key_ops to RSA keys; "use" already says the same.
+            jwk.pop("key_ops", None)
+            self.jwks["keys"].append(
+                {**jwk, "kid": kid, "alg": algorithm, "use": "sig"}
+            )
+
+    def encode(self, payload: dict) -> str:
+        if self._signing_key is None:
+            return jwt.encode(payload, self._secret, algorithm=self.algorithm)
+        return jwt.encode(
+            payload,
+            self._signing_key,
+            algorithm=self.algorithm,
+            headers={"kid": self.active_kid},
+        )
+
+    def decode(self, token: str) -> dict:
+        if self._signing_key is None:
+            return jwt.decode(token, self._secret, algorithms=[self.algorithm])
+        kid = jwt.get_unverified_header(token).get("kid")
+        key = self._verification_keys.get(kid)
+        if key is None:
+            msg = "Unknown signing key"
+            raise InvalidTokenError(msg)
+        return jwt.decode(token, key, algorithms=[self.algorithm])
+
+
+def _read_keys(files: dict[str, str]) -> dict[str, bytes]:
+    return {kid: Path(path).read_bytes() for kid, path in files.items()}
+
+
+jwt_key_ring = JWTKeyRing(
+    algorithm=settings.JWT_ALGORITHM,
+    secret=settings.JWT_SECRET_KEY,
+    private_keys=_read_keys(settings.JWT_PRIVATE_KEY_FILES),
+    public_keys=_read_keys(settings.JWT_PUBLIC_KEY_FILES),
+    active_kid=settings.JWT_ACTIVE_KID,
+)
@@ -0,0 +1,57 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordRequestForm
+
+from src.config import settings
+from src.rate_limit import RateLimiter, rate_limit_backend
+
+login_username_limiter = RateLimiter(
+    "login_username",
+    rate_limit_backend,
+    limit=settings.LOGIN_RATE_LIMIT_PER_USERNAME,
+    window=settings.RATE_LIMIT_WINDOW_SECONDS,
+)
+login_ip_limiter = RateLimiter(
+    "login_ip",
+    rate_limit_backend,
+    limit=settings.LOGIN_RATE_LIMIT_PER_IP,
+    window=settings.RATE_LIMIT_WINDOW_SECONDS,
+)
+register_ip_limiter = RateLimiter(
+    "register_ip",
+    rate_limit_backend,
+    limit=settings.REGISTER_RATE_LIMIT_PER_IP,
+    window=settings.RATE_LIMIT_WINDOW_SECONDS,
+)
+rate_limiters = (login_username_limiter, login_ip_limiter, register_ip_limiter)
+
+
+def _client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
+async def _check(limiter: RateLimiter, key: str) -> None:
+    if not await limiter.hit(key):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many attempts, try again later",
+            headers={"Retry-After": str(int(limiter.window))},
+        )
+
+
+async def limit_login(
+    request: Request,
+    form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
+) -> None:
+    """Shed login attempts before the user lookup and argon2 verify."""
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    await _check(login_ip_limiter, _client_ip(request))
+    await _check(login_username_limiter, form_data.username.lower())
+
+
+async def limit_register(request: Request) -> None:
+    if not settings.RATE_LIMIT_ENABLED:
+        return
+    await _check(register_ip_limiter, _client_ip(request))
@@ -0,0 +1,81 @@
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.routes.auth.models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRevocationList:
+    """Process-wide set of revoked access token ids.
+
+    Lookups are a dict membership test, so the auth dependency never goes to
+    the database. Revocations made by this worker are visible at once; those
+    made by other workers are picked up by the periodic sync from the
+    ``revoked_tokens`` table. Entries are dropped once the token expires.
+    """
+
+    def __init__(self):
+        self._revoked: dict[str, datetime] = {}
+        self._task: asyncio.Task | None = None
+
+    def is_revoked(self, jti: str) -> bool:
+        return jti in self._revoked
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        self._revoked[jti] = expires_at
+
+    async def sync(self, db_session: AsyncSession) -> None:
+        now = datetime.now()  # noqa: DTZ005
+        await db_session.execute(
+            delete(RevokedToken).where(RevokedToken.expires_at <= now)
+        )
+        res = await db_session.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at)
+        )
+        await db_session.commit()
+        revoked = {
+            jti: expires_at
+            for jti, expires_at in self._revoked.items()
+            if expires_at > now
+        }
+        revoked.update(res.tuples().all())
+        self._revoked = revoked
+
+    async def start(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval: float,
+    ) -> None:
+        async with session_factory() as db_session:
+            await self.sync(db_session)
+        self._task = asyncio.create_task(self._run(session_factory, interval))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(
+        self,
+        session_factory: Callable[[], AsyncSession],
+        interval: float,
+    ) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with session_factory() as db_session:
+                    await self.sync(db_session)
+            except Exception:
+                logger.exception("Token revocation list sync failed")
+
+
+revocation_list = TokenRevocationList()
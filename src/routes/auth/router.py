@@ -1,17 +1,33 @@
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response, UploadFile
 from fastapi.security import OAuth2PasswordRequestForm
 
-from src.dependencies.auth import AuthUserDep
-from src.routes.auth.schemas import Token, UserRegister
+from src.config import settings
+from src.dependencies.auth import AuthUserDep, TokenDataDep, require_permissions
+from src.routes.auth.keys import jwt_key_ring
+from src.routes.auth.rate_limit import limit_login, limit_register
+from src.routes.auth.schemas import (
+    LogoutRequest,
+    RefreshTokenRequest,
+    Token,
+    UserBulkRegisterResult,
+    UserRegister,
+)
 from src.routes.auth.service import AuthServiceDep
+from src.routes.role.permissions import Permission
 from src.routes.user.schemas import UserSchema
 
 auth_router = APIRouter(prefix="/auth", tags=["authentication"])
+well_known_router = APIRouter(prefix="/.well-known", tags=["authentication"])
 
+add_users = require_permissions(
+    Permission.ADD_USER,
+    detail="You do not have permission to add users",
+)
 
-@auth_router.post("/login")
+
+@auth_router.post("/login", dependencies=[Depends(limit_login)])
 async def login(
     service: AuthServiceDep,
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
@@ -19,7 +35,26 @@ async def login(
     return await service.login(form_data)
 
 
-@auth_router.post("/register")
+@auth_router.post("/refresh")
+async def refresh(
+    service: AuthServiceDep,
+    request: RefreshTokenRequest,
+) -> Token:
+    return await service.refresh(request.refresh_token)
+
+
+@auth_router.post("/logout")
+async def logout(
+    service: AuthServiceDep,
+    user: AuthUserDep,
+    token_data: TokenDataDep,
+    request: LogoutRequest | None = None,
+) -> None:
+    refresh_token = request.refresh_token if request is not None else None
+    return await service.logout(user, token_data, refresh_token)
+
+
+@auth_router.post("/register", dependencies=[Depends(limit_register)])
 async def register(
     service: AuthServiceDep,
     user_register: UserRegister,
@@ -27,6 +62,25 @@ async def register(
     return await service.register(user_register)
 
 
+@auth_router.post("/register/bulk", dependencies=[Depends(add_users)])
+async def register_bulk(
+    service: AuthServiceDep,
+    rows: list[dict[str, Any]],
+) -> UserBulkRegisterResult:
+    return await service.register_bulk(rows)
+
+
+@auth_router.post("/register/bulk/csv", dependencies=[Depends(add_users)])
+async def register_bulk_csv(
+    service: AuthServiceDep,
+    file: UploadFile,
+) -> UserBulkRegisterResult:
+    # Reading one byte past the limit is enough to tell an oversized upload
+    # apart without loading it whole.
+    content = await file.read(settings.BULK_REGISTER_MAX_CSV_BYTES + 1)
+    return await service.register_bulk_csv(content)
+
+
 @auth_router.get("/me")
 async def get_me(user: AuthUserDep) -> UserSchema:
     return user
@@ -34,7 +88,16 @@ async def get_me(user: AuthUserDep) -> UserSchema:
 
 @auth_router.delete("/me")
 async def delete_me(
-        service: AuthServiceDep,
-        user: AuthUserDep,
+    service: AuthServiceDep,
+    user: AuthUserDep,
+    token_data: TokenDataDep,
 ) -> None:
-    return await service.deactivate_account(user)
+    return await service.deactivate_account(user, token_data)
+
+
+@well_known_router.get("/jwks.json")
+async def get_jwks(response: Response) -> dict[str, list[dict[str, Any]]]:
+    response.headers["Cache-Control"] = (
+        f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}"
+    )
+    return jwt_key_ring.jwks
@@ -1,5 +1,9 @@
+from datetime import datetime
+
 from pydantic import BaseModel, EmailStr
 
+from src.routes.user.schemas import UserSchema
+
 
 class UserRegister(BaseModel):
     username: str
@@ -11,7 +15,29 @@ class UserRegister(BaseModel):
 class Token(BaseModel):
     access_token: str
     token_type: str
+    refresh_token: str | None = None
+
+
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
+
+
+class LogoutRequest(BaseModel):
+    refresh_token: str | None = None
 
 
 class TokenData(BaseModel):
     username: str | None = None
+    jti: str | None = None
+    expires_at: datetime | None = None
+
+
+class UserBulkRegisterFailure(BaseModel):
+    row: int
+    username: str | None = None
+    detail: str
+
+
+class UserBulkRegisterResult(BaseModel):
+    created: list[UserSchema]
+    failed: list[UserBulkRegisterFailure]
@@ -1,69 +1,291 @@
+import csv
+import hashlib
+import io
+import itertools
+import secrets
+import uuid
 from datetime import UTC, datetime, timedelta
-from typing import Annotated
+from typing import Annotated, Any
 
-import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import BackgroundTasks, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from pwdlib import PasswordHash
+from pydantic import ValidationError
 
 from src.config import settings
-from src.routes.auth.schemas import Token, UserRegister
+from src.dependencies.database import AsyncSessionLocal
+from src.metrics import auth_failures
+from src.routes.auth.data_access import (
+    RefreshTokenDataAccessDep,
+    RevokedTokenDataAccessDep,
+)
+from src.routes.auth.hashing import PasswordHasherDep
+from src.routes.auth.keys import jwt_key_ring
+from src.routes.auth.revocation import revocation_list
+from src.routes.auth.schemas import (
+    Token,
+    TokenData,
+    UserBulkRegisterFailure,
+    UserBulkRegisterResult,
+    UserRegister,
+)
+from src.routes.user.data_access import UserDataAccess
 from src.routes.user.schemas import UserInDBSchema, UserSchema
 from src.routes.user.service import UserServiceDep
 
-SECRET_KEY = settings.JWT_SECRET_KEY  # settings.JWT_SECRET_KEY
-ALGORITHM = settings.ALGORITHM
-ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
-
-password_hash = PasswordHash.recommended()
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
+def _hash_refresh_token(token: str) -> str:
+    # Refresh tokens are random 256-bit values, so a fast hash is enough and
+    # lets the lookup use the unique index on token_hash.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
 class AuthService:
-    def __init__(self, user_service: UserServiceDep):
+    def __init__(
+        self,
+        user_service: UserServiceDep,
+        password_hasher: PasswordHasherDep,
+        refresh_tokens: RefreshTokenDataAccessDep,
+        revoked_tokens: RevokedTokenDataAccessDep,
+        background_tasks: BackgroundTasks,
+    ):
         self.user_service = user_service
+        self.password_hasher = password_hasher
+        self.refresh_tokens = refresh_tokens
+        self.revoked_tokens = revoked_tokens
+        self.background_tasks = background_tasks
 
     async def login(self, form_data: OAuth2PasswordRequestForm) -> Token:
         user = await self._authenticate_user(form_data.username, form_data.password)
         if not user or user.is_active is False:
+            auth_failures.inc("bad_credentials")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect username or password",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = self._create_access_token(
-            data={"sub": user.username}, expires_delta=access_token_expires
+        refresh_token = secrets.token_urlsafe(32)
+        await self.refresh_tokens.add_token(
+            user.id,
+            _hash_refresh_token(refresh_token),
+            self._refresh_token_expires_at(),
         )
-        return Token(access_token=access_token, token_type="bearer")  # noqa: S106
+        return self._create_token(user.username, refresh_token)
+
+    async def refresh(self, refresh_token: str) -> Token:
+        new_refresh_token = secrets.token_urlsafe(32)
+        username = await self.refresh_tokens.rotate_token(
+            _hash_refresh_token(refresh_token),
+            _hash_refresh_token(new_refresh_token),
+            self._refresh_token_expires_at(),
+        )
+        if username is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid refresh token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return self._create_token(username, new_refresh_token)
 
     async def register(
         self,
         user_register_schema: UserRegister,
         is_admin: bool = False,
     ) -> UserSchema:
-        user = await self.user_service.get_user_by_username(
-            user_register_schema.username
+        hashed_password = await self.password_hasher.hash(user_register_schema.password)
+        user = await self.user_service.add_user(
+            user_register_schema, hashed_password, is_admin
         )
-        if user:
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already registered",
             )
-        hashed_password = password_hash.hash(user_register_schema.password)
-        return await self.user_service.add_user(
-            user_register_schema, hashed_password, is_admin
-        )
+        return user
+
+    async def register_bulk(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> UserBulkRegisterResult:
+        self._check_bulk_register_size(len(rows))
+        return await self._register_bulk(*self._validate_rows(rows))
+
+    async def register_bulk_csv(self, content: bytes) -> UserBulkRegisterResult:
+        if len(content) > settings.BULK_REGISTER_MAX_CSV_BYTES:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=(
+                    f"CSV file must be at most "
+                    f"{settings.BULK_REGISTER_MAX_CSV_BYTES} bytes"
+                ),
+            )
+        try:
+            text = content.decode("utf-8-sig")
+        except UnicodeDecodeError as err:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="CSV file must be UTF-8 encoded",
+            ) from err
+        reader = csv.DictReader(io.StringIO(text))
+        rows = list(itertools.islice(reader, settings.BULK_REGISTER_MAX_ROWS + 1))
+        self._check_bulk_register_size(len(rows))
+        return await self._register_bulk(*self._validate_rows(rows))
+
+    async def logout(
+        self,
+        user: UserSchema,
+        token_data: TokenData,
+        refresh_token: str | None = None,
+    ) -> None:
+        if refresh_token is not None:
+            await self.refresh_tokens.revoke_token(
+                user.id, _hash_refresh_token(refresh_token)
+            )
+        await self._revoke_access_token(token_data)
 
-    async def deactivate_account(self, user: UserSchema) -> None:
+    async def deactivate_account(
+        self,
+        user: UserSchema,
+        token_data: TokenData,
+    ) -> None:
+        await self.refresh_tokens.revoke_user_tokens(user.id)
+        await self._revoke_access_token(token_data)
         await self.user_service.data_access.deactivate_account(user.id)
 
+    async def _revoke_access_token(self, token_data: TokenData) -> None:
+        # Tokens issued before jti was introduced cannot be listed; they
+        # expire on their own within ACCESS_TOKEN_EXPIRE_MINUTES.
+        if token_data.jti is None:
+            return
+        await self.revoked_tokens.add_token(token_data.jti, token_data.expires_at)
+        revocation_list.add(token_data.jti, token_data.expires_at)
+
     async def _authenticate_user(self, username: str, password: str) -> UserInDBSchema:
         user = await self.user_service.get_user_by_username(username)
-        if not user or not password_hash.verify(password, user.hashed_password):
+        if not user or not await self.password_hasher.verify(
+            password, user.hashed_password
+        ):
             return False
+        if self.password_hasher.needs_rehash(user.hashed_password):
+            self.background_tasks.add_task(self._rehash_password, user, password)
         return user
 
+    async def _rehash_password(self, user: UserInDBSchema, password: str) -> None:
+        # Runs after the response is sent, when the request session is
+        # already closed, so it opens its own.
+        try:
+            hashed_password = await self.password_hasher.hash(password)
+        except HTTPException:
+            # The hashing pool is saturated; the next login retries.
+            return
+        async with AsyncSessionLocal() as db_session:
+            await UserDataAccess(db_session, db_session).update_password_hash(
+                user, hashed_password
+            )
+
+    def _check_bulk_register_size(self, rows: int) -> None:
+        if rows > settings.BULK_REGISTER_MAX_ROWS:
+            raise HTTPException(
+                status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+                detail=f"At most {settings.BULK_REGISTER_MAX_ROWS} users per request",
+            )
+
+    def _validate_rows(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> tuple[list[tuple[int, UserRegister]], list[UserBulkRegisterFailure]]:
+        users, failed = [], []
+        for index, row in enumerate(rows):
+            try:
+                users.append((index, UserRegister.model_validate(row)))
+            except ValidationError as err:
+                username = row.get("username")
+                failed.append(
+                    UserBulkRegisterFailure(
+                        row=index,
+                        username=username if isinstance(username, str) else None,
+                        detail="; ".join(
+                            f"{'.'.join(map(str, e['loc']))}: {e['msg']}"
+                            for e in err.errors()
+                        ),
+                    )
+                )
+        return users, failed
+
+    async def _register_bulk(
+        self,
+        users: list[tuple[int, UserRegister]],
+        failed: list[UserBulkRegisterFailure],
+    ) -> UserBulkRegisterResult:
+        unique_users = {}
+        for index, user in users:
+            if user.username in unique_users:
+                failed.append(
+                    UserBulkRegisterFailure(
+                        row=index,
+                        username=user.username,
+                        detail="Duplicate username in request",
+                    )
+                )
+                continue
+            unique_users[user.username] = (index, user)
+
+        existing = await self.user_service.get_existing_usernames(list(unique_users))
+        to_create = []
+        for username, (index, user) in unique_users.items():
+            if username in existing:
+                failed.append(
+                    UserBulkRegisterFailure(
+                        row=index,
+                        username=username,
+                        detail="Username already registered",
+                    )
+                )
+                continue
+            to_create.append((index, user))
+
+        hashed_passwords = await self.password_hasher.hash_many(
+            [user.password for _, user in to_create]
+        )
+        created = await self.user_service.add_users(
+            [
+                (user, hashed_password)
+                for (_, user), hashed_password in zip(
+                    to_create, hashed_passwords, strict=True
+                )
+            ]
+        )
+
+        created_usernames = {user.username for user in created}
+        failed.extend(
+            UserBulkRegisterFailure(
+                row=index,
+                username=user.username,
+                detail="Username already registered",
+            )
+            for index, user in to_create
+            if user.username not in created_usernames
+        )
+        failed.sort(key=lambda failure: failure.row)
+        return UserBulkRegisterResult(created=created, failed=failed)
+
+    def _create_token(self, username: str, refresh_token: str) -> Token:
+        access_token = self._create_access_token(
+            data={"sub": username},
+            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+        )
+        return Token(
+            access_token=access_token,
+            token_type="bearer",  # noqa: S106
+            refresh_token=refresh_token,
+        )
+
+    def _refresh_token_expires_at(self) -> datetime:
+        return datetime.now() + timedelta(  # noqa: DTZ005
+            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
+        )
+
     def _create_access_token(
         self,
         data: dict,
@@ -74,8 +296,8 @@ class AuthService:
             expire = datetime.now(UTC) + expires_delta
         else:
             expire = datetime.now(UTC) + timedelta(minutes=15)
-        to_encode.update({"exp": expire})
-        return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+        to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
+        return jwt_key_ring.encode(to_encode)
 
 
 AuthServiceDep = Annotated[AuthService, Depends(AuthService)]
@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.routes.metrics.service import MetricsServiceDep
+
+metrics_router = APIRouter(tags=["metrics"])
+
+
+@metrics_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(service: MetricsServiceDep) -> PlainTextResponse:
+    return PlainTextResponse(
+        await service.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
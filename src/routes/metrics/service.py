@@ -0,0 +1,113 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.dependencies.database import get_pool_stats
+from src.metrics import format_labels, format_metric, registry
+from src.routes.auth.cache import auth_user_cache
+from src.routes.auth.hashing import password_hasher
+from src.routes.auth.rate_limit import rate_limiters
+
+# get_pool_stats() key -> (metric name, type, help)
+POOL_METRICS = {
+    "size": ("db_pool_size", "gauge", "Configured pool size."),
+    "checked_in": ("db_pool_checked_in", "gauge", "Idle connections."),
+    "checked_out": ("db_pool_checked_out", "gauge", "Connections in use."),
+    "overflow": ("db_pool_overflow", "gauge", "Connections beyond pool size."),
+    "wait_count": ("db_pool_checkouts_total", "counter", "Connection checkouts."),
+    "wait_seconds_total": (
+        "db_pool_wait_seconds_total",
+        "counter",
+        "Time spent waiting for a connection.",
+    ),
+    "wait_seconds_max": (
+        "db_pool_wait_seconds_max",
+        "gauge",
+        "Longest wait for a connection.",
+    ),
+}
+
+
+class MetricsService:
+    async def render(self) -> str:
+        lines = []
+        for metric in registry:
+            lines.extend(metric.render())
+        lines.extend(self._hashing_metrics())
+        lines.extend(self._pool_metrics())
+        lines.extend(self._cache_metrics())
+        lines.extend(self._rate_limit_metrics())
+        return "\n".join(lines) + "\n"
+
+    def _hashing_metrics(self) -> list[str]:
+        return [
+            *format_metric(
+                "password_hashing_in_flight",
+                "gauge",
+                "Password hashing jobs running in the executor.",
+                [("password_hashing_in_flight", password_hasher.in_flight)],
+            ),
+            *format_metric(
+                "password_hashing_queue_depth",
+                "gauge",
+                "Password hashing jobs waiting for a free worker.",
+                [("password_hashing_queue_depth", password_hasher.queue_depth)],
+            ),
+        ]
+
+    def _pool_metrics(self) -> list[str]:
+        pools = get_pool_stats()
+        lines = []
+        for key, (name, kind, documentation) in POOL_METRICS.items():
+            lines.extend(
+                format_metric(
+                    name,
+                    kind,
+                    documentation,
+                    [
+                        (name + format_labels(("pool",), (pool,)), stats[key])
+                        for pool, stats in pools.items()
+                    ],
+                )
+            )
+        return lines
+
+    def _cache_metrics(self) -> list[str]:
+        stats = auth_user_cache.stats()
+        labels = format_labels(("cache",), (auth_user_cache.name,))
+        return [
+            *format_metric(
+                "cache_hits_total",
+                "counter",
+                "Cache lookups that found an entry.",
+                [(f"cache_hits_total{labels}", stats["hits"])],
+            ),
+            *format_metric(
+                "cache_misses_total",
+                "counter",
+                "Cache lookups that found nothing.",
+                [(f"cache_misses_total{labels}", stats["misses"])],
+            ),
+            *format_metric(
+                "cache_hit_ratio",
+                "gauge",
+                "Share of cache lookups that were hits.",
+                [(f"cache_hit_ratio{labels}", stats["hit_rate"])],
+            ),
+        ]
+
+    def _rate_limit_metrics(self) -> list[str]:
+        samples = []
+        for limiter in rate_limiters:
+            for outcome, value in limiter.stats().items():
+                labels = format_labels(("limiter", "outcome"), (limiter.name, outcome))
+                samples.append((f"rate_limit_requests_total{labels}", value))
+        return format_metric(
+            "rate_limit_requests_total",
+            "counter",
+            "Rate-limited requests by limiter and outcome (allowed/shed).",
+            samples,
+        )
+
+
+MetricsServiceDep = Annotated[MetricsService, Depends(MetricsService)]
@@ -3,35 +3,39 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy import select, update
 
-from src.dependencies.database import DBSessionDep
+from src.dependencies.database import DBSessionDep, ReadDBSessionDep
+from src.routes.auth.cache import auth_user_cache
 from src.routes.role.models import Role, RoleAccess
 from src.routes.role.schemas import RoleAccessSchema, RoleSchema
 
 
 class RoleDataAccess:
-    def __init__(self, db_session: DBSessionDep):
+    def __init__(self, db_session: DBSessionDep, read_session: ReadDBSessionDep):
         self.db_session = db_session
+        self.read_session = read_session
 
-    async def get_role_permissions(self, role_id: int) -> RoleAccessSchema:
-        res = await self.db_session.execute(
-            select(RoleAccess).where(RoleAccess.role_id == role_id)
+    async def get_role_permissions(self, role_id: int) -> RoleAccessSchema | None:
+        res = await self.read_session.execute(
+            select(RoleAccess.permissions).where(RoleAccess.role_id == role_id)
         )
-        role_access_obj = res.scalar_one_or_none()
-        if role_access_obj is None:
+        mask = res.scalar_one_or_none()
+        if mask is None:
             return None
-        return RoleAccessSchema.model_validate(role_access_obj)
+        return RoleAccessSchema.from_mask(mask)
 
     async def get_roles_with_permissions(
         self,
     ) -> list[tuple[RoleSchema, RoleAccessSchema]]:
-        res = await self.db_session.execute(
-            select(Role, RoleAccess).join(RoleAccess, Role.id == RoleAccess.role_id)
+        res = await self.read_session.execute(
+            select(Role, RoleAccess.permissions).join(
+                RoleAccess, Role.id == RoleAccess.role_id
+            )
         )
 
         roles_with_permissions = []
-        for role, access in res.all():
+        for role, mask in res.all():
             role_schema = RoleSchema.model_validate(role)
-            access_schema = RoleAccessSchema.model_validate(access)
+            access_schema = RoleAccessSchema.from_mask(mask)
             roles_with_permissions.append((role_schema, access_schema))
 
         return roles_with_permissions
@@ -40,17 +44,19 @@ class RoleDataAccess:
         self,
         role_id: int,
         permissions: RoleAccessSchema,
-    ) -> RoleAccessSchema:
-        await self.db_session.execute(
-            select(RoleAccess).where(RoleAccess.role_id == role_id)
-        )
-        await self.db_session.execute(
+    ) -> RoleAccessSchema | None:
+        res = await self.db_session.execute(
             update(RoleAccess)
             .where(RoleAccess.role_id == role_id)
-            .values(**permissions.model_dump())
+            .values(permissions=permissions.to_mask())
+            .returning(RoleAccess.permissions)
         )
+        mask = res.scalar_one_or_none()
         await self.db_session.commit()
-        return permissions
+        if mask is None:
+            return None
+        await auth_user_cache.invalidate()
+        return RoleAccessSchema.from_mask(mask)
 
 
 RoleDataAccessDep = Annotated[RoleDataAccess, Depends(RoleDataAccess)]
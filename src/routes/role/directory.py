@@ -0,0 +1,30 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.routes.role.models import Role
+
+
+class RoleDirectory:
+    """Process-wide role name to id mapping.
+
+    Loaded on startup and reloaded whenever an unknown role name is asked
+    for, so newly added roles are picked up without a restart.
+    """
+
+    def __init__(self):
+        self._ids: dict[str, int] = {}
+
+    async def load(self, db_session: AsyncSession) -> None:
+        res = await db_session.execute(select(Role.name, Role.id))
+        self._ids = dict(res.tuples().all())
+
+    async def get_id(self, name: str, db_session: AsyncSession) -> int:
+        if name not in self._ids:
+            await self.load(db_session)
+            if name not in self._ids:
+                msg = f"Role {name!r} does not exist"
+                raise RuntimeError(msg)
+        return self._ids[name]
+
+
+role_directory = RoleDirectory()
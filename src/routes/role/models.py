@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from sqlalchemy import Column, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from src.dependencies.database import base
@@ -12,14 +12,10 @@ class Role(base):
 
     users = relationship("User", back_populates="role")
 
+
 class RoleAccess(base):
     __tablename__ = "role_access"
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
-    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
-    add_user_permission = Column(Boolean, default=False)
-    read_users_permission = Column(Boolean, default=False)
-    update_users_permission = Column(Boolean, default=False)
-    delete_users_permission = Column(Boolean, default=False)
-    read_roles_permission = Column(Boolean, default=False)
-    update_roles_permission = Column(Boolean, default=False)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False, unique=True)
+    permissions = Column(Integer, nullable=False, default=0, server_default="0")
@@ -0,0 +1,26 @@
+from enum import IntFlag
+
+
+class Permission(IntFlag):
+    """Role permissions, stored together as a bitmask in ``role_access``.
+
+    New permissions only need a new flag here and a matching field on
+    ``RoleAccessSchema``; existing bits must never be renumbered.
+    """
+
+    ADD_USER = 1
+    READ_USERS = 2
+    UPDATE_USERS = 4
+    DELETE_USERS = 8
+    READ_ROLES = 16
+    UPDATE_ROLES = 32
+
+
+PERMISSION_FIELDS: dict[str, Permission] = {
+    "add_user_permission": Permission.ADD_USER,
+    "read_users_permission": Permission.READ_USERS,
+    "update_users_permission": Permission.UPDATE_USERS,
+    "delete_users_permission": Permission.DELETE_USERS,
+    "read_roles_permission": Permission.READ_ROLES,
+    "update_roles_permission": Permission.UPDATE_ROLES,
+}
@@ -1,36 +1,41 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
-from src.routes.auth.dependencies import AuthUserDep
+from src.dependencies.auth import require_permissions
+from src.routes.role.permissions import Permission
 from src.routes.role.schemas import RoleAccessSchema
 from src.routes.role.service import RoleServiceDep
 
 role_router = APIRouter(prefix="/roles", tags=["roles"])
 
+read_roles = require_permissions(
+    Permission.READ_ROLES,
+    detail="You do not have permission read roles",
+)
+update_roles = require_permissions(
+    Permission.UPDATE_ROLES,
+    detail="You do not have permission to update roles",
+)
 
-@role_router.get("/")
+
+@role_router.get("/", dependencies=[Depends(read_roles)])
 async def get_roles(
     service: RoleServiceDep,
-    current_user: AuthUserDep,
 ):
-    return await service.get_roles_with_permissions(current_user)
+    return await service.get_roles_with_permissions()
 
 
-@role_router.get("/{role_id}")
+@role_router.get("/{role_id}", dependencies=[Depends(read_roles)])
 async def get_role_permissions(
     role_id: int,
     service: RoleServiceDep,
-    current_user: AuthUserDep,
 ):
-    return await service.get_role_permissions(role_id, current_user)
+    return await service.get_role_permissions(role_id)
 
 
-@role_router.put("/{role_id}")
+@role_router.put("/{role_id}", dependencies=[Depends(update_roles)])
 async def update_role_permissions(
     role_id: int,
     permissions: RoleAccessSchema,
     service: RoleServiceDep,
-    current_user: AuthUserDep,
 ):
-    return await service.update_role_permissions(
-        role_id, permissions, current_user
-    )
+    return await service.update_role_permissions(role_id, permissions)
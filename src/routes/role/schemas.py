@@ -1,5 +1,7 @@
 from pydantic import BaseModel, ConfigDict
 
+from src.routes.role.permissions import PERMISSION_FIELDS, Permission
+
 
 class RoleSchema(BaseModel):
     id: int
@@ -17,3 +19,19 @@ class RoleAccessSchema(BaseModel):
     update_roles_permission: bool
 
     model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "RoleAccessSchema":
+        return cls(
+            **{
+                field: bool(mask & permission)
+                for field, permission in PERMISSION_FIELDS.items()
+            }
+        )
+
+    def to_mask(self) -> Permission:
+        mask = Permission(0)
+        for field, permission in PERMISSION_FIELDS.items():
+            if getattr(self, field):
+                mask |= permission
+        return mask
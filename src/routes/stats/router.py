@@ -0,0 +1,39 @@
+from fastapi import APIRouter, Depends
+
+from src.dependencies.auth import require_permissions
+from src.routes.role.permissions import Permission
+from src.routes.stats.service import StatsServiceDep
+
+stats_router = APIRouter(
+    prefix="/stats",
+    tags=["stats"],
+    dependencies=[
+        Depends(
+            require_permissions(
+                Permission.READ_USERS,
+                detail="You do not have permission to view stats",
+            )
+        )
+    ],
+)
+
+
+@stats_router.get("/auth-cache")
+async def get_auth_cache_stats(
+    service: StatsServiceDep,
+) -> dict[str, int | float]:
+    return await service.get_auth_cache_stats()
+
+
+@stats_router.get("/db-pool")
+async def get_db_pool_stats(
+    service: StatsServiceDep,
+) -> dict[str, dict[str, int | float]]:
+    return await service.get_db_pool_stats()
+
+
+@stats_router.get("/rate-limit")
+async def get_rate_limit_stats(
+    service: StatsServiceDep,
+) -> dict[str, dict[str, int]]:
+    return await service.get_rate_limit_stats()
@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import Depends
+
+from src.dependencies.database import get_pool_stats
+from src.routes.auth.cache import auth_user_cache
+from src.routes.auth.rate_limit import rate_limiters
+
+
+class StatsService:
+    async def get_auth_cache_stats(self) -> dict[str, int | float]:
+        return auth_user_cache.stats()
+
+    async def get_db_pool_stats(self) -> dict[str, dict[str, int | float]]:
+        return get_pool_stats()
+
+    async def get_rate_limit_stats(self) -> dict[str, dict[str, int]]:
+        return {limiter.name: limiter.stats() for limiter in rate_limiters}
+
+
+StatsServiceDep = Annotated[StatsService, Depends(StatsService)]
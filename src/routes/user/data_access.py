@@ -1,59 +1,109 @@
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import Depends, HTTPException
+from fastapi import Depends
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import Select, String, any_, bindparam, func, literal, select, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 
-from src.dependencies.database import DBSessionDep
+from src.dependencies.database import DBSessionDep, ReadDBSessionDep
+from src.routes.auth.cache import auth_user_cache
 from src.routes.auth.schemas import UserRegister
+from src.routes.role.directory import role_directory
 from src.routes.role.models import Role, RoleAccess
 from src.routes.user.models import User
-from src.routes.user.schemas import UserInDBSchema, UserSchema
+from src.routes.user.schemas import (
+    UserFilterParams,
+    UserInDBSchema,
+    UserListParams,
+    UserPrincipalSchema,
+    UserSchema,
+)
+
+USERS_STREAM_BATCH_SIZE = 1000
+USERS_INSERT_BATCH_SIZE = 1000
+
+
+def _users_query(params: UserFilterParams) -> Select:
+    query = select(
+        User.id,
+        User.username,
+        User.full_name,
+        User.email,
+        User.registered_date,
+        Role.name.label("role"),
+    ).join(Role)
+    if params.role is not None:
+        query = query.where(Role.name == params.role)
+    if params.is_active is not None:
+        query = query.where(User.is_active.is_(params.is_active))
+    if params.registered_from is not None:
+        query = query.where(User.registered_date >= params.registered_from)
+    if params.registered_to is not None:
+        query = query.where(User.registered_date < params.registered_to)
+    return query
 
 
 class UserDataAccess:
-    def __init__(self, db_session: DBSessionDep):
+    def __init__(self, db_session: DBSessionDep, read_session: ReadDBSessionDep):
         self.db_session = db_session
+        self.read_session = read_session
 
-    async def get_user_permissions(self, user_id: int) -> dict[str, bool]:
-        res = await self.db_session.execute(select(User).where(User.id == user_id))
-        user = res.scalars().first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-
-        res = await self.db_session.execute(
-            select(RoleAccess).where(RoleAccess.role_id == user.role_id)
-        )
-        role_access = res.scalars().first()
-        if not role_access:
-            return {}
+    async def get_users(
+        self,
+        params: UserListParams,
+        *,
+        validate: bool = True,
+    ) -> tuple[list[UserSchema], int | None]:
+        """Page of users after ``params.after`` and the cursor of the next one.
 
-        return {
-            c.name: getattr(role_access, c.name)
-            for c in role_access.__table__.columns
-            if c.name not in ("id", "role_id")
-        }
+        With ``validate=False`` rows are trusted as written, which skips the
+        EmailStr checks that are most of the per-row cost of a large page,
+        but rows with bad data are returned instead of dropped.
+        """
+        query = _users_query(params).order_by(User.id).limit(params.limit + 1)
+        if params.after is not None:
+            query = query.where(User.id > params.after)
 
-    async def get_users(self) -> list[UserInDBSchema]:
-        res = await self.db_session.execute(
-            select(User, Role.name.label("role_name")).join(Role)
-        )
+        rows = (await self.read_session.execute(query)).mappings().all()
+        next_after = rows[params.limit - 1]["id"] if len(rows) > params.limit else None
+        if not validate:
+            return [
+                UserSchema.model_construct(**row) for row in rows[: params.limit]
+            ], next_after
         users = []
-        for user_obj, role_name in res.all():
+        for row in rows[: params.limit]:
             try:
-                users.append(
-                    UserInDBSchema.model_validate(
-                        {**user_obj.__dict__, "role": role_name}
-                    )
-                )
+                users.append(UserSchema.model_validate(row))
             except ValidationError:
                 continue
-        return users
+        return users, next_after
+
+    async def stream_users(
+        self,
+        params: UserFilterParams,
+    ) -> AsyncIterator[UserSchema]:
+        # Reads run in autocommit mode, where server-side cursors are not
+        # available, so the export walks the id index in keyset batches.
+        query = _users_query(params).order_by(User.id).limit(USERS_STREAM_BATCH_SIZE)
+        after = None
+        while True:
+            batch = query if after is None else query.where(User.id > after)
+            rows = (await self.read_session.execute(batch)).all()
+            for row in rows:
+                try:
+                    yield UserSchema.model_validate(row)
+                except ValidationError:
+                    continue
+            if len(rows) < USERS_STREAM_BATCH_SIZE:
+                return
+            after = rows[-1].id
 
     async def get_user_by_username(self, username: str) -> UserInDBSchema | None:
-        res = await self.db_session.execute(
-            select(User, Role.name.label("role_name")).
-            join(Role).where(User.username == username)
+        res = await self.read_session.execute(
+            select(User, Role.name.label("role_name"))
+            .join(Role)
+            .where(User.username == username)
         )
         row = res.first()
         if row is None:
@@ -69,10 +119,45 @@ class UserDataAccess:
         except ValidationError:
             return None
 
-    async def get_user_by_id(self, user_id: int) -> UserInDBSchema | None:
+    async def get_principal_by_username(
+        self,
+        username: str,
+    ) -> UserPrincipalSchema | None:
+        # Read from the primary: the result is cached, and a lagging replica
+        # could put back a principal that was just invalidated. Committing
+        # right away releases the connection, so it is not held while the
+        # rest of the request reads through read_session.
         res = await self.db_session.execute(
-            select(User, Role.name.label("role_name")).
-            join(Role).where(User.id == user_id)
+            select(
+                User.id,
+                User.username,
+                User.full_name,
+                User.email,
+                User.registered_date,
+                Role.name.label("role"),
+                User.role_id,
+                User.is_active,
+                func.coalesce(RoleAccess.permissions, 0).label("permissions"),
+            )
+            .select_from(User)
+            .join(Role, Role.id == User.role_id)
+            .outerjoin(RoleAccess, RoleAccess.role_id == User.role_id)
+            .where(User.username == username)
+        )
+        row = res.mappings().first()
+        await self.db_session.commit()
+        if row is None:
+            return None
+        try:
+            return UserPrincipalSchema.model_validate(row)
+        except ValidationError:
+            return None
+
+    async def get_user_by_id(self, user_id: int) -> UserInDBSchema | None:
+        res = await self.read_session.execute(
+            select(User, Role.name.label("role_name"))
+            .join(Role)
+            .where(User.id == user_id)
         )
         row = res.first()
         if row is None:
@@ -93,33 +178,112 @@ class UserDataAccess:
         user: UserRegister,
         hashed_password: str,
         is_admin: bool,
-    ) -> UserSchema:
-        user_obj = User(**user.model_dump(exclude={"password"}))
-        user_obj.hashed_password = hashed_password
-        role = "user"
-        if is_admin:
-            role = "admin"
-        role_obj = (
-            (await self.db_session.execute(select(Role).where(Role.name == role)))
-            .scalars()
-            .first()
+    ) -> UserSchema | None:
+        """Insert the user; ``None`` if the username is already taken.
+
+        A concurrent registration of the same username hits ON CONFLICT
+        instead of a unique violation. The role id comes from the role
+        directory, so a missing role raises instead of reading as a
+        conflict.
+        """
+        role = "admin" if is_admin else "user"
+        role_id = await role_directory.get_id(role, self.db_session)
+        res = await self.db_session.execute(
+            insert(User)
+            .values(
+                **user.model_dump(exclude={"password"}),
+                hashed_password=hashed_password,
+                role_id=role_id,
+            )
+            .on_conflict_do_nothing(index_elements=[User.username])
+            .returning(
+                User.id,
+                User.username,
+                User.full_name,
+                User.email,
+                User.registered_date,
+                literal(role).label("role"),
+            )
         )
-        user_obj.role_id = role_obj.id
-        self.db_session.add(user_obj)
+        row = res.one_or_none()
         await self.db_session.commit()
-        await self.db_session.refresh(user_obj)
-        return UserSchema.model_validate(
-            {
-                **user_obj.__dict__,
-                "role": role_obj.name,
-            }
+        if row is None:
+            return None
+        return UserSchema.model_validate(row)
+
+    async def get_existing_usernames(self, usernames: list[str]) -> set[str]:
+        res = await self.db_session.execute(
+            select(User.username).where(
+                User.username
+                == any_(bindparam("usernames", usernames, type_=ARRAY(String)))
+            )
         )
+        return set(res.scalars().all())
+
+    async def add_users(
+        self,
+        users: list[tuple[UserRegister, str]],
+        role: str = "user",
+    ) -> list[UserSchema]:
+        """Insert users in batches, skipping usernames that already exist."""
+        role_id = await role_directory.get_id(role, self.db_session)
+        created = []
+        for start in range(0, len(users), USERS_INSERT_BATCH_SIZE):
+            chunk = users[start : start + USERS_INSERT_BATCH_SIZE]
+            res = await self.db_session.execute(
+                insert(User)
+                .values(
+                    [
+                        {
+                            **user.model_dump(exclude={"password"}),
+                            "hashed_password": hashed_password,
+                            "role_id": role_id,
+                        }
+                        for user, hashed_password in chunk
+                    ]
+                )
+                .on_conflict_do_nothing(index_elements=[User.username])
+                .returning(
+                    User.id,
+                    User.username,
+                    User.full_name,
+                    User.email,
+                    User.registered_date,
+                    literal(role).label("role"),
+                )
+            )
+            created.extend(UserSchema.model_validate(row) for row in res)
+        await self.db_session.commit()
+        return created
 
     async def deactivate_account(self, user_id: int) -> None:
-        user = await self.db_session.get(User, user_id)
-        user.is_active = 0
+        res = await self.db_session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(is_active=False)
+            .returning(User.username)
+        )
+        username = res.scalar_one_or_none()
+        await self.db_session.commit()
+        if username is not None:
+            await auth_user_cache.invalidate(username)
+
+    async def update_password_hash(
+        self,
+        user: UserInDBSchema,
+        hashed_password: str,
+    ) -> None:
+        """Replace the user's hash unless it changed since ``user`` was read."""
+        await self.db_session.execute(
+            update(User)
+            .where(
+                User.id == user.id,
+                User.hashed_password == user.hashed_password,
+            )
+            .values(hashed_password=hashed_password)
+        )
         await self.db_session.commit()
-        await self.db_session.refresh(user)
+        await auth_user_cache.invalidate(user.username)
 
 
 UsersDataAccessDep = Annotated[UserDataAccess, Depends(UserDataAccess)]
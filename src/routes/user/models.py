@@ -15,7 +15,6 @@ class User(base):
     email = Column(String, nullable=False)
     registered_date = Column(DateTime, default=datetime.now)
     hashed_password = Column(String, nullable=False)
-    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False)
+    role_id = Column(Integer, ForeignKey("roles.id"), nullable=False, index=True)
     role = relationship("Role", back_populates="users")
     is_active = Column(Boolean, default=True)
-
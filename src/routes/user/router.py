@@ -1,15 +1,40 @@
-from fastapi import APIRouter
+from typing import Annotated
 
-from src.dependencies.auth import AuthUserDep
-from src.routes.user.schemas import UserSchema
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.responses import StreamingResponse
+
+from src.dependencies.auth import require_permissions
+from src.routes.role.permissions import Permission
+from src.routes.user.schemas import UserExportParams, UserListParams, UserSchema
 from src.routes.user.service import UserServiceDep
 
 user_router = APIRouter(prefix="/users", tags=["users"])
 
+read_users = require_permissions(
+    Permission.READ_USERS,
+    detail="You do not have permission to view users",
+)
+
 
-@user_router.get("/")
+@user_router.get("/", dependencies=[Depends(read_users)])
 async def get_users(
     service: UserServiceDep,
-    current_user: AuthUserDep,
+    params: Annotated[UserListParams, Query()],
+    response: Response,
 ) -> list[UserSchema]:
-    return await service.get_users(current_user)
+    users, next_after = await service.get_users(params)
+    if next_after is not None:
+        response.headers["X-Next-Cursor"] = str(next_after)
+    return users
+
+
+@user_router.get("/export", dependencies=[Depends(read_users)])
+async def export_users(
+    service: UserServiceDep,
+    params: Annotated[UserExportParams, Query()],
+) -> StreamingResponse:
+    media_type = "text/csv" if params.format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        service.export_users(params),
+        media_type=media_type,
+    )
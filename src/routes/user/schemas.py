@@ -1,6 +1,9 @@
 from datetime import datetime
+from typing import Literal
 
-from pydantic import BaseModel, ConfigDict, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from src.routes.role.permissions import Permission
 
 
 class UserSchema(BaseModel):
@@ -16,4 +19,32 @@ class UserSchema(BaseModel):
 
 class UserInDBSchema(UserSchema):
     hashed_password: str
+    role_id: int
+    is_active: bool
+
+
+class UserPrincipalSchema(UserSchema):
+    """Authenticated user as cached between requests, without the hash."""
+
+    role_id: int
     is_active: bool
+    permissions: int
+
+    def has_permission(self, permission: Permission) -> bool:
+        return self.permissions & permission == permission
+
+
+class UserFilterParams(BaseModel):
+    role: str | None = None
+    is_active: bool | None = None
+    registered_from: datetime | None = None
+    registered_to: datetime | None = None
+
+
+class UserListParams(UserFilterParams):
+    limit: int = Field(100, ge=1, le=1000)
+    after: int | None = None
+
+
+class UserExportParams(UserFilterParams):
+    format: Literal["ndjson", "csv"] = "ndjson"
@@ -1,30 +1,69 @@
+import csv
+import io
+from collections.abc import AsyncIterator
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends
 from pydantic import ValidationError
 
+from src.config import settings
 from src.routes.auth.schemas import UserRegister
 from src.routes.user.data_access import UsersDataAccessDep
-from src.routes.user.schemas import UserInDBSchema, UserSchema
+from src.routes.user.schemas import (
+    UserExportParams,
+    UserInDBSchema,
+    UserListParams,
+    UserPrincipalSchema,
+    UserSchema,
+)
+
+EXPORT_CHUNK_SIZE = 1000
+
+
+async def _users_to_ndjson(users: AsyncIterator[UserSchema]) -> AsyncIterator[str]:
+    chunk = []
+    async for user in users:
+        chunk.append(user.model_dump_json())
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+async def _users_to_csv(users: AsyncIterator[UserSchema]) -> AsyncIterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(UserSchema.model_fields))
+    writer.writeheader()
+    rows = 0
+    async for user in users:
+        writer.writerow(user.model_dump(mode="json"))
+        rows += 1
+        if rows >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            rows = 0
+    yield buffer.getvalue()
 
 
 class UserService:
     def __init__(self, user_data_access: UsersDataAccessDep):
         self.data_access = user_data_access
 
-    async def get_users(self, current_user: UserSchema) -> list[UserSchema]:
-        if not await self.check_user_permission(
-            current_user.id,
-            "read_users_permission",
-        ):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You do not have permission to view users",
-            )
-        return [
-            UserInDBSchema.model_validate(i)
-            for i in (await self.data_access.get_users())
-        ]
+    async def get_users(
+        self,
+        params: UserListParams,
+    ) -> tuple[list[UserSchema], int | None]:
+        return await self.data_access.get_users(
+            params, validate=not settings.FAST_LIST_RESPONSES
+        )
+
+    def export_users(self, params: UserExportParams) -> AsyncIterator[str]:
+        users = self.data_access.stream_users(params)
+        if params.format == "csv":
+            return _users_to_csv(users)
+        return _users_to_ndjson(users)
 
     async def get_user_by_username(
         self,
@@ -37,17 +76,28 @@ class UserService:
         except ValidationError:
             return None
 
+    async def get_principal_by_username(
+        self,
+        username: str,
+    ) -> UserPrincipalSchema | None:
+        return await self.data_access.get_principal_by_username(username)
+
+    async def get_existing_usernames(self, usernames: list[str]) -> set[str]:
+        return await self.data_access.get_existing_usernames(usernames)
+
+    async def add_users(
+        self,
+        users: list[tuple[UserRegister, str]],
+    ) -> list[UserSchema]:
+        return await self.data_access.add_users(users)
+
     async def add_user(
         self,
         user: UserRegister,
         hashed_password: str,
         is_admin: bool,
-    ) -> UserSchema:
+    ) -> UserSchema | None:
         return await self.data_access.add_user(user, hashed_password, is_admin)
 
-    async def check_user_permission(self, user_id: int, permission: str) -> bool:
-        permissions = await self.data_access.get_user_permissions(user_id)
-        return permissions.get(permission, False)
-
 
 UserServiceDep = Annotated[UserService, Depends(UserService)]
@@ -0,0 +1,48 @@
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import pytest
+from dotenv import dotenv_values
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Settings() needs these at import time. Values from the environment or .env
+# win; the defaults only matter to tests that reach the database, and those
+# skip themselves when it is not there.
+TEST_SETTINGS = {
+    "POSTGRES_USER": "postgres",
+    "POSTGRES_PASSWORD": "postgres",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_DB": "testtask",
+    "JWT_SECRET_KEY": "test-secret",
+}
+
+_env_file = dotenv_values(Path(__file__).parents[1] / ".env")
+for name, value in TEST_SETTINGS.items():
+    if name not in _env_file:
+        os.environ.setdefault(name, value)
+
+# src.dependencies.auth and the routers import each other; loading the app
+# first resolves the cycle the same way uvicorn does.
+import src.main  # noqa: E402, F401
+from src.dependencies.database import engine  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[AsyncEngine]:
+    """Yield the configured PostgreSQL engine, skipping if it is unreachable."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except (OSError, DBAPIError) as err:
+        pytest.skip(f"PostgreSQL is not available: {err}")
+    yield engine
+    await engine.dispose()
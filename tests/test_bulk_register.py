@@ -0,0 +1,60 @@
+import pytest
+from fastapi import HTTPException, status
+
+from src.config import settings
+from src.routes.auth.service import AuthService
+
+
+@pytest.fixture
+def service() -> AuthService:
+    return AuthService(None, None, None, None, None)
+
+
+def test_validate_rows_reports_each_invalid_row(service: AuthService) -> None:
+    users, failed = service._validate_rows(
+        [
+            {
+                "username": "alice",
+                "password": "password",
+                "email": "alice@example.com",
+                "full_name": "Alice",
+            },
+            {"username": "bob", "password": "password", "full_name": "Bob"},
+            {"username": 5},
+        ]
+    )
+    assert [(index, user.username) for index, user in users] == [(0, "alice")]
+    assert [(failure.row, failure.username) for failure in failed] == [
+        (1, "bob"),
+        (2, None),
+    ]
+    assert failed[0].detail == "email: Field required"
+
+
+@pytest.mark.anyio
+async def test_csv_must_be_utf8(service: AuthService) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await service.register_bulk_csv("username\nzoë\n".encode("latin-1"))
+    assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.anyio
+async def test_csv_size_is_limited(
+    service: AuthService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "BULK_REGISTER_MAX_CSV_BYTES", 16)
+    with pytest.raises(HTTPException) as exc_info:
+        await service.register_bulk_csv(b"username\n" + b"alice\n" * 2)
+    assert exc_info.value.status_code == status.HTTP_413_CONTENT_TOO_LARGE
+
+
+@pytest.mark.anyio
+async def test_csv_row_count_is_limited(
+    service: AuthService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "BULK_REGISTER_MAX_ROWS", 2)
+    with pytest.raises(HTTPException) as exc_info:
+        await service.register_bulk_csv(b"username\na\nb\nc\nd\n")
+    assert exc_info.value.status_code == status.HTTP_413_CONTENT_TOO_LARGE
@@ -0,0 +1,197 @@
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+
+from src import cache as cache_module
+from src.cache import (
+    Cache,
+    InvalidationBus,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    RedisInvalidationBus,
+    TTLCache,
+)
+from src.routes.user.schemas import UserPrincipalSchema
+
+pytestmark = pytest.mark.anyio
+
+PRINCIPAL = UserPrincipalSchema(
+    id=1,
+    username="alice",
+    full_name="Alice",
+    email="alice@example.com",
+    registered_date=datetime(2025, 1, 1),  # noqa: DTZ001
+    role="user",
+    role_id=1,
+    is_active=True,
+    permissions=0,
+)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def test_ttl_cache_expires_entries(clock: Clock) -> None:
+    ttl_cache = TTLCache(max_size=10, ttl=30)
+    ttl_cache.set("key", "value")
+    clock.now += 30
+    assert ttl_cache.get("key") == "value"
+    clock.now += 0.001
+    assert ttl_cache.get("key") is None
+    assert ttl_cache.stats() == {"size": 0, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+
+@pytest.mark.usefixtures("clock")
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    ttl_cache = TTLCache(max_size=2, ttl=30)
+    ttl_cache.set("a", 1)
+    ttl_cache.set("b", 2)
+    ttl_cache.get("a")
+    ttl_cache.set("c", 3)
+    assert ttl_cache.get("a") == 1
+    assert ttl_cache.get("b") is None
+    assert ttl_cache.get("c") == 3  # noqa: PLR2004
+
+
+async def test_redis_backend_does_not_store_password_hash() -> None:
+    client = FakeAsyncRedis()
+    backend = RedisCacheBackend(client, "auth_user", UserPrincipalSchema, ttl=30)
+    await backend.set("alice", PRINCIPAL)
+    assert b"hashed_password" not in await client.get("auth_user:alice")
+    assert await backend.get("alice") == PRINCIPAL
+
+
+async def test_invalidate_drops_key_or_everything() -> None:
+    cache = Cache("users", MemoryCacheBackend(max_size=10, ttl=30), InvalidationBus())
+    await cache.set("alice", PRINCIPAL)
+    await cache.set("bob", PRINCIPAL)
+    await cache.invalidate("alice")
+    assert await cache.get("alice") is None
+    assert await cache.get("bob") == PRINCIPAL
+    await cache.invalidate()
+    assert await cache.get("bob") is None
+
+
+async def _until(condition: Callable[[], Awaitable[bool]]) -> None:
+    async with asyncio.timeout(2):
+        while not await condition():  # noqa: ASYNC110
+            await asyncio.sleep(0.01)
+
+
+async def _subscribed(buses: list[RedisInvalidationBus]) -> bool:
+    counts = await buses[0].client.pubsub_numsub("invalidation")
+    return counts[0][1] == len(buses)
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+async def buses(server: FakeServer) -> AsyncIterator[list[RedisInvalidationBus]]:
+    buses = [
+        RedisInvalidationBus(FakeAsyncRedis(server=server), "invalidation")
+        for _ in range(2)
+    ]
+    for bus in buses:
+        await bus.start()
+    yield buses
+    for bus in buses:
+        await bus.stop()
+
+
+def _memory_cache(bus: InvalidationBus) -> Cache:
+    return Cache("users", MemoryCacheBackend(max_size=10, ttl=30), bus)
+
+
+async def test_invalidation_reaches_other_workers(
+    buses: list[RedisInvalidationBus],
+) -> None:
+    caches = [_memory_cache(bus) for bus in buses]
+    await _until(lambda: _subscribed(buses))
+    for cache in caches:
+        await cache.set("alice", PRINCIPAL)
+
+    await caches[0].invalidate("alice")
+
+    async def invalidated() -> bool:
+        return await caches[1].get("alice") is None
+
+    await _until(invalidated)
+
+
+class FlakyRedis(FakeAsyncRedis):
+    """Fake client whose first pub/sub connection fails to subscribe."""
+
+    failures = 1
+
+    def pubsub(self, **kwargs):  # noqa: ANN003, ANN201
+        pubsub = super().pubsub(**kwargs)
+        if self.failures:
+            self.failures -= 1
+
+            async def subscribe(*_args: str) -> None:
+                raise ConnectionError
+
+            pubsub.subscribe = subscribe
+        return pubsub
+
+
+async def test_listener_resubscribes_and_clears_local_caches(
+    server: FakeServer,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(cache_module, "RECONNECT_DELAY_SECONDS", 0.01)
+    bus = RedisInvalidationBus(FlakyRedis(server=server), "invalidation")
+    cache = _memory_cache(bus)
+    await cache.set("alice", PRINCIPAL)
+    await bus.start()
+    try:
+        await _until(lambda: _subscribed([bus]))
+        assert await cache.get("alice") is None
+        assert not bus._listener.done()
+    finally:
+        await bus.stop()
+
+
+@pytest.fixture
+def down_server() -> FakeServer:
+    server = FakeServer()
+    server.connected = False
+    return server
+
+
+async def test_redis_errors_read_as_cache_misses(down_server: FakeServer) -> None:
+    backend = RedisCacheBackend(
+        FakeAsyncRedis(server=down_server), "auth_user", UserPrincipalSchema, ttl=30
+    )
+    await backend.set("alice", PRINCIPAL)
+    assert await backend.get("alice") is None
+    assert backend.stats()["misses"] == 1
+
+
+async def test_invalidate_survives_redis_outage(down_server: FakeServer) -> None:
+    client = FakeAsyncRedis(server=down_server)
+    cache = Cache(
+        "auth_user",
+        RedisCacheBackend(client, "auth_user", UserPrincipalSchema, ttl=30),
+        RedisInvalidationBus(client, "invalidation"),
+    )
+    await cache.invalidate("alice")
+    await cache.invalidate()
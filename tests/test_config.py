@@ -0,0 +1,16 @@
+import pytest
+from pydantic import ValidationError
+
+from src.config import Settings
+
+
+@pytest.mark.parametrize("name", ["CACHE_BACKEND", "RATE_LIMIT_BACKEND"])
+def test_redis_backend_requires_redis_url(name: str) -> None:
+    with pytest.raises(ValidationError, match=f"{name}=redis requires REDIS_URL"):
+        Settings(**{name: "redis"}, REDIS_URL=None)
+
+
+@pytest.mark.parametrize("name", ["CACHE_BACKEND", "RATE_LIMIT_BACKEND"])
+def test_redis_backend_with_redis_url(name: str) -> None:
+    settings = Settings(**{name: "redis"}, REDIS_URL="redis://localhost")
+    assert settings.REDIS_URL == "redis://localhost"
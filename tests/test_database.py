@@ -0,0 +1,95 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI, status
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.config import settings
+from src.dependencies import database as database_module
+from src.dependencies.database import DBSessionDep, ReadDBSessionDep
+
+pytestmark = pytest.mark.anyio
+
+REQUESTS = 5
+
+
+@pytest.fixture
+async def single_connection_pool(
+    database: AsyncEngine,
+    monkeypatch: pytest.MonkeyPatch,
+) -> AsyncIterator[AsyncEngine]:
+    small = create_async_engine(
+        settings.DATABASE_URL,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=3,
+    )
+    # Swap the pool under the primary engine, so every session bound to it
+    # (or to an engine derived from it) draws from the single connection.
+    monkeypatch.setattr(database.sync_engine, "pool", small.sync_engine.pool)
+    monkeypatch.setattr(database_module.replica_router, "engines", [])
+    yield database
+    await small.dispose()
+
+
+@pytest.fixture
+def app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/")
+    async def read_then_write(
+        db_session: DBSessionDep,
+        read_session: ReadDBSessionDep,
+    ) -> None:
+        # Shaped like an authenticated write: the principal is loaded on the
+        # primary, the handler reads, then writes and commits.
+        await db_session.execute(text("SELECT 1"))
+        await db_session.commit()
+        await read_session.execute(text("SELECT 1"))
+        await asyncio.sleep(0.05)
+        await read_session.scalar(text("SELECT 1"))
+        await db_session.execute(text("SELECT 1"))
+        await db_session.commit()
+
+    return app
+
+
+async def test_reads_release_their_connection(
+    single_connection_pool: AsyncEngine,
+) -> None:
+    reads = database_module.get_read_db()
+    session = await anext(reads)
+    assert await session.scalar(text("SELECT 1")) == 1
+    await session.execute(text("SELECT 1"))
+    assert not session.in_transaction()
+    assert single_connection_pool.pool.checkedout() == 0
+    await reads.aclose()
+
+
+@pytest.mark.usefixtures("single_connection_pool")
+async def test_concurrent_requests_with_one_connection(app: FastAPI) -> None:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        responses = await asyncio.gather(*(client.post("/") for _ in range(REQUESTS)))
+    assert [r.status_code for r in responses] == [status.HTTP_200_OK] * REQUESTS
+
+
+@pytest.mark.usefixtures("database")
+async def test_failed_statement_does_not_leave_a_start_time() -> None:
+    engine = create_async_engine(settings.DATABASE_URL, pool_size=1)
+    database_module._instrument_queries(engine)
+    try:
+        async with engine.connect() as conn:
+            with pytest.raises(DBAPIError):
+                await conn.execute(text("SELECT 1 / 0"))
+            await conn.rollback()
+            await conn.execute(text("SELECT 1"))
+            raw = await conn.get_raw_connection()
+            assert raw.info["query_started"] == []
+    finally:
+        await engine.dispose()
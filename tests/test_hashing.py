@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.routes.auth.hashing import PasswordHasher, password_hash
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def hasher() -> PasswordHasher:
+    return PasswordHasher(ThreadPoolExecutor(max_workers=2), max_workers=2, max_queue=1)
+
+
+async def test_hash_many(hasher: PasswordHasher) -> None:
+    passwords = ["first", "second", "third"]
+    hashed_passwords = await hasher.hash_many(passwords)
+    assert [
+        password_hash.verify(password, hashed)
+        for password, hashed in zip(passwords, hashed_passwords, strict=True)
+    ] == [True, True, True]
+    assert hasher._pending == 0
+
+
+async def test_hash_many_respects_queue_cap(hasher: PasswordHasher) -> None:
+    hasher._pending = hasher.max_workers + hasher.max_queue
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash_many(["password"])
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert exc_info.value.headers == {"Retry-After": "1"}
@@ -0,0 +1,101 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+from httpx import ASGITransport, AsyncClient
+from jwt.exceptions import InvalidTokenError
+
+from src.main import app
+from src.routes.auth import router as auth_router
+from src.routes.auth.keys import JWTKeyRing
+
+
+def _pem(private_key: rsa.RSAPrivateKey | ed25519.Ed25519PrivateKey) -> bytes:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+
+
+def _public_pem(private_key: rsa.RSAPrivateKey | ed25519.Ed25519PrivateKey) -> bytes:
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+
+
+def _new_key(algorithm: str) -> rsa.RSAPrivateKey | ed25519.Ed25519PrivateKey:
+    if algorithm == "RS256":
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return ed25519.Ed25519PrivateKey.generate()
+
+
+def _key_ring(algorithm: str) -> JWTKeyRing:
+    if algorithm == "HS256":
+        return JWTKeyRing("HS256", "secret", {}, {}, None)
+    return JWTKeyRing(
+        algorithm,
+        "secret",
+        private_keys={"current": _pem(_new_key(algorithm))},
+        public_keys={"previous": _public_pem(_new_key(algorithm))},
+        active_kid="current",
+    )
+
+
+@pytest.mark.parametrize("algorithm", ["HS256", "RS256", "EdDSA"])
+def test_encode_decode_round_trip(algorithm: str) -> None:
+    key_ring = _key_ring(algorithm)
+    token = key_ring.encode({"sub": "alice"})
+    assert key_ring.decode(token) == {"sub": "alice"}
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "EdDSA"])
+def test_tokens_carry_active_kid(algorithm: str) -> None:
+    token = _key_ring(algorithm).encode({"sub": "alice"})
+    assert jwt.get_unverified_header(token)["kid"] == "current"
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "EdDSA"])
+def test_decode_rejects_foreign_keys(algorithm: str) -> None:
+    token = _key_ring(algorithm).encode({"sub": "alice"})
+    with pytest.raises(InvalidTokenError):
+        _key_ring(algorithm).decode(token)
+
+
+def test_active_kid_must_have_private_key() -> None:
+    with pytest.raises(RuntimeError, match="JWT_ACTIVE_KID"):
+        JWTKeyRing("RS256", "secret", {"current": _pem(_new_key("RS256"))}, {}, "x")
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("algorithm", ["HS256", "RS256", "EdDSA"])
+async def test_jwks_endpoint(
+    algorithm: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    key_ring = _key_ring(algorithm)
+    monkeypatch.setattr(auth_router, "jwt_key_ring", key_ring)
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200  # noqa: PLR2004
+    keys = response.json()["keys"]
+    assert keys == key_ring.jwks["keys"]
+    if algorithm == "HS256":
+        assert keys == []
+        return
+    assert {key["kid"] for key in keys} == {"current", "previous"}
+    for key in keys:
+        assert key["alg"] == algorithm
+        assert key["use"] == "sig"
+        assert "key_ops" not in key
+
+    # Other services must be able to verify tokens from the JWKS alone.
+    current = next(key for key in keys if key["kid"] == "current")
+    token = key_ring.encode({"sub": "alice"})
+    assert jwt.decode(token, jwt.PyJWK(current).key, algorithms=[algorithm]) == {
+        "sub": "alice"
+    }
@@ -0,0 +1,68 @@
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException, status
+
+from src.dependencies.auth import require_permissions
+from src.routes.role.permissions import PERMISSION_FIELDS, Permission
+from src.routes.role.schemas import RoleAccessSchema
+from src.routes.user.schemas import UserPrincipalSchema
+
+ALL_MASKS = range(1 << len(Permission))
+
+
+def _principal(permissions: Permission) -> UserPrincipalSchema:
+    return UserPrincipalSchema(
+        id=1,
+        username="alice",
+        full_name="Alice",
+        email="alice@example.com",
+        registered_date=datetime(2025, 1, 1),  # noqa: DTZ001
+        role="user",
+        role_id=1,
+        is_active=True,
+        permissions=permissions,
+    )
+
+
+def test_every_permission_has_a_field() -> None:
+    assert set(PERMISSION_FIELDS.values()) == set(Permission)
+    assert set(PERMISSION_FIELDS) == set(RoleAccessSchema.model_fields)
+
+
+@pytest.mark.parametrize("mask", ALL_MASKS)
+def test_mask_round_trip(mask: int) -> None:
+    schema = RoleAccessSchema.from_mask(mask)
+    assert schema.to_mask() == mask
+    assert RoleAccessSchema.from_mask(schema.to_mask()) == schema
+
+
+def test_from_mask_sets_matching_fields() -> None:
+    schema = RoleAccessSchema.from_mask(Permission.READ_USERS | Permission.READ_ROLES)
+    assert {field for field, value in schema if value} == {
+        "read_users_permission",
+        "read_roles_permission",
+    }
+
+
+def test_has_permission_requires_every_bit() -> None:
+    user = _principal(Permission.READ_USERS | Permission.UPDATE_USERS)
+    assert user.has_permission(Permission.READ_USERS)
+    assert user.has_permission(Permission.READ_USERS | Permission.UPDATE_USERS)
+    assert not user.has_permission(Permission.READ_USERS | Permission.DELETE_USERS)
+
+
+@pytest.mark.anyio
+async def test_require_permissions() -> None:
+    check = require_permissions(
+        Permission.READ_ROLES,
+        Permission.UPDATE_ROLES,
+        detail="Nope",
+    )
+    allowed = _principal(Permission.READ_ROLES | Permission.UPDATE_ROLES)
+    assert await check(allowed) is allowed
+
+    with pytest.raises(HTTPException) as exc_info:
+        await check(_principal(Permission.READ_ROLES))
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+    assert exc_info.value.detail == "Nope"
@@ -0,0 +1,121 @@
+"""Query-plan regression check for the user and role data access layers.
+
+Runs every ``UserDataAccess`` and ``RoleDataAccess`` method against a seeded
+database inside a transaction that is rolled back, captures the SQL they
+emit and ``EXPLAIN``s each statement with sequential scans disabled, so a
+lookup on a table of any size shows up as a ``Seq Scan`` only when no index
+can serve it.
+"""
+
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from benchmarks.seed import ADMIN_USERNAME, USER_ROLE_ID, grow_users, reset
+from src.routes.auth.schemas import UserRegister
+from src.routes.role.data_access import RoleDataAccess
+from src.routes.role.schemas import RoleAccessSchema
+from src.routes.user.data_access import UserDataAccess
+from src.routes.user.schemas import UserFilterParams, UserListParams
+
+pytestmark = pytest.mark.anyio
+
+CHECKED_TABLES = {"users", "role_access"}
+SKIPPED_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+USERS = 10_000
+
+
+async def exercise(session: AsyncSession) -> None:
+    users = UserDataAccess(session, session)
+    roles = RoleDataAccess(session, session)
+
+    await users.get_users(UserListParams())
+    await users.get_users(UserListParams(after=USERS // 2))
+    await users.get_users(UserListParams(role="admin"))
+    await users.get_users(UserListParams(role="user", is_active=True))
+    async for _ in users.stream_users(UserFilterParams(role="admin")):
+        pass
+    user = await users.get_user_by_username(ADMIN_USERNAME)
+    await users.get_principal_by_username(ADMIN_USERNAME)
+    await users.get_user_by_id(user.id)
+    await users.get_existing_usernames([ADMIN_USERNAME, "bench_user_1"])
+    registered = UserRegister(
+        username="plan_user",
+        password="plan-password",  # noqa: S106
+        email="plan@bench.example",
+        full_name="Plan",
+    )
+    await users.add_user(registered, "hash", is_admin=False)
+    await users.add_users([(registered.model_copy(update={"username": "x"}), "hash")])
+    await users.update_password_hash(user, "hash")
+    await users.deactivate_account(user.id)
+
+    permissions = await roles.get_role_permissions(USER_ROLE_ID)
+    await roles.get_roles_with_permissions()
+    await roles.update_role_permissions(
+        USER_ROLE_ID, permissions or RoleAccessSchema.from_mask(0)
+    )
+
+
+def seq_scans(plan: dict[str, Any]) -> Iterator[str]:
+    if plan.get("Node Type") == "Seq Scan" and plan["Relation Name"] in CHECKED_TABLES:
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from seq_scans(child)
+
+
+@pytest.fixture
+async def connection(database: AsyncEngine) -> AsyncIterator[AsyncConnection]:
+    async with database.connect() as conn:
+        transaction = await conn.begin()
+        try:
+            await reset(conn)
+            await grow_users(conn, USERS)
+            yield conn
+        finally:
+            await transaction.rollback()
+
+
+async def test_data_access_does_not_scan_large_tables(
+    connection: AsyncConnection,
+) -> None:
+    statements: dict[str, Any] = {}
+
+    def capture(
+        _conn: Connection,
+        _cursor: Any,  # noqa: ANN401
+        statement: str,
+        parameters: Any,  # noqa: ANN401
+        _context: Any,  # noqa: ANN401
+        _executemany: bool,
+    ) -> None:
+        if not statement.startswith(SKIPPED_PREFIXES):
+            statements.setdefault(statement, parameters)
+
+    session = AsyncSession(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    try:
+        await exercise(session)
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+    await connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    failures = []
+    for statement, parameters in statements.items():
+        res = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        scanned = sorted(set(seq_scans(res.scalar_one()[0]["Plan"])))
+        if scanned:
+            summary = " ".join(statement.split())[:120]
+            failures.append(f"seq scan on {', '.join(scanned)}: {summary}")
+    assert not failures, "\n".join(failures)
+    assert any("role_access" in statement for statement in statements)
@@ -0,0 +1,202 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from fakeredis import FakeAsyncRedis, FakeServer
+from fastapi import Depends, FastAPI, status
+from httpx import ASGITransport, AsyncClient
+
+from src import rate_limit as rate_limit_module
+from src.config import settings
+from src.rate_limit import (
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+    RedisRateLimitBackend,
+)
+from src.routes.auth import rate_limit as auth_rate_limit
+from src.routes.auth.rate_limit import limit_login, limit_register
+
+pytestmark = pytest.mark.anyio
+
+WINDOW = 60
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(rate_limit_module.time, "monotonic", clock)
+    monkeypatch.setattr(rate_limit_module.time, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "redis"])
+def backend(request: pytest.FixtureRequest) -> RateLimitBackend:
+    if request.param == "redis":
+        return RedisRateLimitBackend(FakeAsyncRedis(), "rate-limit")
+    return MemoryRateLimitBackend(max_keys=100)
+
+
+async def _hits(backend: RateLimitBackend, key: str, count: int) -> list[bool]:
+    return [await backend.hit(key, 2, WINDOW) for _ in range(count)]
+
+
+async def test_limit_within_window(backend: RateLimitBackend, clock: Clock) -> None:
+    assert await _hits(backend, "key", 3) == [True, True, False]
+    clock.now += WINDOW - 0.001
+    assert await _hits(backend, "key", 1) == [False]
+
+
+async def test_window_slides(backend: RateLimitBackend, clock: Clock) -> None:
+    assert await _hits(backend, "key", 1) == [True]
+    clock.now += WINDOW / 2
+    assert await _hits(backend, "key", 2) == [True, False]
+    # The first hit leaves the window exactly WINDOW seconds after it landed;
+    # the second one is still inside it.
+    clock.now += WINDOW / 2
+    assert await _hits(backend, "key", 2) == [True, False]
+    clock.now += WINDOW / 2
+    assert await _hits(backend, "key", 2) == [True, False]
+
+
+async def test_rejected_hits_do_not_extend_the_window(
+    backend: RateLimitBackend,
+    clock: Clock,
+) -> None:
+    assert await _hits(backend, "key", 2) == [True, True]
+    for _ in range(5):
+        clock.now += WINDOW / 10
+        assert await _hits(backend, "key", 1) == [False]
+    clock.now += WINDOW / 2
+    assert await _hits(backend, "key", 2) == [True, True]
+
+
+@pytest.mark.usefixtures("clock")
+async def test_keys_are_independent(backend: RateLimitBackend) -> None:
+    assert await _hits(backend, "a", 3) == [True, True, False]
+    assert await _hits(backend, "b", 2) == [True, True]
+
+
+@pytest.mark.usefixtures("clock")
+async def test_redis_backend_fails_open() -> None:
+    server = FakeServer()
+    server.connected = False
+    backend = RedisRateLimitBackend(FakeAsyncRedis(server=server), "rate-limit")
+    assert await _hits(backend, "key", 3) == [True, True, True]
+
+
+@pytest.mark.usefixtures("clock")
+async def test_memory_backend_evicts_idle_keys() -> None:
+    backend = MemoryRateLimitBackend(max_keys=2)
+    for key in ("a", "b", "a", "c"):
+        await backend.hit(key, 1, WINDOW)
+    assert list(backend._hits) == ["a", "c"]
+
+
+@pytest.mark.usefixtures("clock")
+async def test_limiter_counts_allowed_and_shed() -> None:
+    backend = MemoryRateLimitBackend(max_keys=100)
+    first = RateLimiter("first", backend, limit=1, window=WINDOW)
+    second = RateLimiter("second", backend, limit=1, window=WINDOW)
+    assert [await first.hit("key") for _ in range(3)] == [True, False, False]
+    # Limiters sharing a backend do not share counters.
+    assert await second.hit("key")
+    assert first.stats() == {"allowed": 1, "shed": 2}
+    assert second.stats() == {"allowed": 1, "shed": 0}
+
+
+@pytest.fixture
+def limited_app(monkeypatch: pytest.MonkeyPatch) -> FastAPI:
+    backend = MemoryRateLimitBackend(max_keys=100)
+    for name, limit in (
+        ("login_username_limiter", 2),
+        ("login_ip_limiter", 3),
+        ("register_ip_limiter", 1),
+    ):
+        monkeypatch.setattr(
+            auth_rate_limit,
+            name,
+            RateLimiter(name, backend, limit=limit, window=WINDOW),
+        )
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+
+    app = FastAPI()
+
+    @app.post("/login", dependencies=[Depends(limit_login)])
+    async def login() -> None:
+        pass
+
+    @app.post("/register", dependencies=[Depends(limit_register)])
+    async def register() -> None:
+        pass
+
+    return app
+
+
+@pytest.fixture
+async def client(limited_app: FastAPI) -> AsyncIterator[AsyncClient]:
+    async with AsyncClient(
+        transport=ASGITransport(app=limited_app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+def _client_from(app: FastAPI, ip: str) -> AsyncClient:
+    return AsyncClient(
+        transport=ASGITransport(app=app, client=(ip, 1234)),
+        base_url="http://test",
+    )
+
+
+async def _login(client: AsyncClient, username: str) -> int:
+    response = await client.post(
+        "/login", data={"username": username, "password": "password"}
+    )
+    return response.status_code
+
+
+async def test_login_limited_per_username(client: AsyncClient) -> None:
+    assert [await _login(client, "alice") for _ in range(2)] == [200, 200]
+    response = await client.post(
+        "/login", data={"username": "Alice", "password": "password"}
+    )
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == str(WINDOW)
+    assert response.json() == {"detail": "Too many attempts, try again later"}
+
+
+async def test_login_limited_per_ip(limited_app: FastAPI) -> None:
+    async with _client_from(limited_app, "10.0.0.1") as client:
+        statuses = [await _login(client, f"user{i}") for i in range(4)]
+    assert statuses == [200, 200, 200, 429]
+    # Another address still gets through, also for a username that the
+    # first address spread its attempts over.
+    async with _client_from(limited_app, "10.0.0.2") as client:
+        assert await _login(client, "user0") == status.HTTP_200_OK
+
+
+async def test_username_limit_applies_across_ips(limited_app: FastAPI) -> None:
+    for ip in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+        async with _client_from(limited_app, ip) as client:
+            last = await _login(client, "alice")
+    assert last == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+async def test_register_limited_per_ip(client: AsyncClient) -> None:
+    assert (await client.post("/register")).status_code == status.HTTP_200_OK
+    response = await client.post("/register")
+    assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+    assert response.headers["Retry-After"] == str(WINDOW)
+
+
+async def test_disabled(client: AsyncClient, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", False)
+    statuses = [await _login(client, "alice") for _ in range(5)]
+    assert statuses == [200] * 5
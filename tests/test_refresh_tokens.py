@@ -0,0 +1,142 @@
+import uuid
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from src.routes.auth.data_access import RefreshTokenDataAccess
+from src.routes.auth.models import RefreshToken
+from src.routes.role.models import Role
+from src.routes.user.models import User
+
+pytestmark = pytest.mark.anyio
+
+USERNAME = "refresh_user"
+
+
+@pytest.fixture
+async def session(database: AsyncEngine) -> AsyncIterator[AsyncSession]:
+    # Commits inside the data access layer only release savepoints; the
+    # outer transaction is rolled back, so the database is left untouched.
+    async with database.connect() as conn:
+        transaction = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            join_transaction_mode="create_savepoint",
+            expire_on_commit=False,
+        )
+        try:
+            yield session
+        finally:
+            await session.close()
+            await transaction.rollback()
+
+
+@pytest.fixture
+async def user_id(session: AsyncSession) -> int:
+    # benchmarks/seed.py inserts roles with explicit ids, so the sequence
+    # may lag behind them.
+    role_id = await session.scalar(select(func.coalesce(func.max(Role.id), 0) + 1))
+    await session.execute(
+        insert(Role).values(id=role_id, name=f"refresh-{uuid.uuid4().hex}")
+    )
+    return await session.scalar(
+        insert(User)
+        .values(
+            username=USERNAME,
+            full_name="Refresh",
+            email="refresh@example.com",
+            hashed_password="hash",  # noqa: S106
+            role_id=role_id,
+            is_active=True,
+        )
+        .returning(User.id)
+    )
+
+
+@pytest.fixture
+def tokens(session: AsyncSession) -> RefreshTokenDataAccess:
+    return RefreshTokenDataAccess(session)
+
+
+def _expires_in(days: float) -> datetime:
+    return datetime.now() + timedelta(days=days)  # noqa: DTZ005
+
+
+async def _rotate(tokens: RefreshTokenDataAccess, old: str, new: str) -> str | None:
+    return await tokens.rotate_token(old, new, _expires_in(30))
+
+
+async def _live(session: AsyncSession, token_hash: str) -> bool:
+    revoked_at = await session.scalar(
+        select(RefreshToken.revoked_at).where(RefreshToken.token_hash == token_hash)
+    )
+    return revoked_at is None
+
+
+async def test_rotation(
+    tokens: RefreshTokenDataAccess,
+    session: AsyncSession,
+    user_id: int,
+) -> None:
+    await tokens.add_token(user_id, "first", _expires_in(30))
+    assert await _rotate(tokens, "first", "second") == USERNAME
+    assert await _rotate(tokens, "second", "third") == USERNAME
+    assert not await _live(session, "first")
+    assert not await _live(session, "second")
+    assert await _live(session, "third")
+
+
+async def test_reuse_revokes_every_token_of_the_user(
+    tokens: RefreshTokenDataAccess,
+    session: AsyncSession,
+    user_id: int,
+) -> None:
+    await tokens.add_token(user_id, "first", _expires_in(30))
+    await tokens.add_token(user_id, "other-device", _expires_in(30))
+    assert await _rotate(tokens, "first", "second") == USERNAME
+
+    assert await _rotate(tokens, "first", "stolen") is None
+    assert not await _live(session, "second")
+    assert not await _live(session, "other-device")
+    assert await _rotate(tokens, "second", "third") is None
+
+
+async def test_expired_token_leaves_other_sessions(
+    tokens: RefreshTokenDataAccess,
+    session: AsyncSession,
+    user_id: int,
+) -> None:
+    await tokens.add_token(user_id, "expired", _expires_in(-1))
+    await tokens.add_token(user_id, "other-device", _expires_in(30))
+
+    assert await _rotate(tokens, "expired", "new") is None
+    assert await _live(session, "other-device")
+    assert await _rotate(tokens, "other-device", "next") == USERNAME
+
+
+@pytest.mark.usefixtures("user_id")
+async def test_unknown_token(
+    tokens: RefreshTokenDataAccess,
+    session: AsyncSession,
+) -> None:
+    assert await _rotate(tokens, "unknown", "new") is None
+    assert not await session.scalar(
+        select(RefreshToken.id).where(RefreshToken.token_hash == "new")  # noqa: S105
+    )
+
+
+async def test_inactive_user_keeps_tokens(
+    tokens: RefreshTokenDataAccess,
+    session: AsyncSession,
+    user_id: int,
+) -> None:
+    await tokens.add_token(user_id, "first", _expires_in(30))
+    await session.execute(
+        update(User).where(User.id == user_id).values(is_active=False)
+    )
+
+    assert await _rotate(tokens, "first", "second") is None
+    assert await _live(session, "first")
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+from typing import Any, Self
+
+import pytest
+
+from src.routes.auth.revocation import TokenRevocationList
+
+pytestmark = pytest.mark.anyio
+
+NOW = datetime.now()  # noqa: DTZ005
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple[str, datetime]]):
+        self.rows = rows
+
+    def tuples(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[tuple[str, datetime]]:
+        return self.rows
+
+
+class FakeSession:
+    """Stands in for the ``revoked_tokens`` table during ``sync``."""
+
+    def __init__(self, rows: list[tuple[str, datetime]]):
+        self.rows = rows
+        self.statements: list[Any] = []
+        self.committed = False
+
+    async def execute(self, statement: Any) -> FakeResult:  # noqa: ANN401
+        self.statements.append(statement)
+        return FakeResult(self.rows)
+
+    async def commit(self) -> None:
+        self.committed = True
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *_args: object) -> None:
+        pass
+
+
+def test_add_is_visible_at_once() -> None:
+    revocation_list = TokenRevocationList()
+    assert not revocation_list.is_revoked("jti")
+    revocation_list.add("jti", NOW + timedelta(minutes=5))
+    assert revocation_list.is_revoked("jti")
+
+
+async def test_sync_picks_up_other_workers_and_drops_expired() -> None:
+    revocation_list = TokenRevocationList()
+    revocation_list.add("local", NOW + timedelta(minutes=5))
+    revocation_list.add("expired", NOW - timedelta(seconds=1))
+    session = FakeSession([("remote", NOW + timedelta(minutes=5))])
+
+    await revocation_list.sync(session)
+
+    assert revocation_list.is_revoked("local")
+    assert revocation_list.is_revoked("remote")
+    assert not revocation_list.is_revoked("expired")
+    assert session.committed
+    # Expired rows are deleted before the live ones are read back.
+    assert [statement.__visit_name__ for statement in session.statements] == [
+        "delete",
+        "select",
+    ]
+
+
+async def test_start_syncs_before_serving_and_stop_cancels() -> None:
+    revocation_list = TokenRevocationList()
+    session = FakeSession([("remote", NOW + timedelta(minutes=5))])
+
+    await revocation_list.start(lambda: session, interval=60)
+    try:
+        assert revocation_list.is_revoked("remote")
+    finally:
+        await revocation_list.stop()
+    assert revocation_list._task is None
@@ -0,0 +1,50 @@
+import pytest
+
+from src.routes.role.directory import RoleDirectory
+
+pytestmark = pytest.mark.anyio
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple[str, int]]):
+        self.rows = rows
+
+    def tuples(self) -> "FakeResult":
+        return self
+
+    def all(self) -> list[tuple[str, int]]:
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows: list[tuple[str, int]]):
+        self.rows = rows
+        self.loads = 0
+
+    async def execute(self, _statement: object) -> FakeResult:
+        self.loads += 1
+        return FakeResult(list(self.rows))
+
+
+async def test_get_id_loads_once() -> None:
+    session = FakeSession([("admin", 1), ("user", 2)])
+    directory = RoleDirectory()
+    assert await directory.get_id("user", session) == 2  # noqa: PLR2004
+    assert await directory.get_id("admin", session) == 1
+    assert session.loads == 1
+
+
+async def test_get_id_reloads_for_new_roles() -> None:
+    session = FakeSession([("user", 2)])
+    directory = RoleDirectory()
+    await directory.load(session)
+    session.rows.append(("auditor", 3))
+    assert await directory.get_id("auditor", session) == 3  # noqa: PLR2004
+    assert session.loads == 2  # noqa: PLR2004
+
+
+async def test_get_id_raises_for_missing_role() -> None:
+    session = FakeSession([("user", 2)])
+    directory = RoleDirectory()
+    with pytest.raises(RuntimeError, match="Role 'admin' does not exist"):
+        await directory.get_id("admin", session)
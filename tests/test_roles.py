@@ -0,0 +1,36 @@
+import pytest
+from fastapi import HTTPException, status
+
+from src.routes.role.schemas import RoleAccessSchema
+from src.routes.role.service import RoleService
+
+pytestmark = pytest.mark.anyio
+
+
+class MissingRoles:
+    async def get_role_permissions(self, _role_id: int) -> None:
+        return None
+
+    async def update_role_permissions(
+        self,
+        _role_id: int,
+        _permissions: RoleAccessSchema,
+    ) -> None:
+        return None
+
+
+@pytest.fixture
+def service() -> RoleService:
+    return RoleService(MissingRoles())
+
+
+async def test_get_unknown_role(service: RoleService) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_role_permissions(404)
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_update_unknown_role(service: RoleService) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await service.update_role_permissions(404, RoleAccessSchema.from_mask(0))
+    assert exc_info.value.status_code == status.HTTP_404_NOT_FOUND